@@ -3,35 +3,79 @@
 # Deadlock Avoidance for Multiple Processes & Resources
 # -------------------------------------------------------------------------
 
-def is_safe(processes, available, maximum, allocation, need):
+import heapq
+import threading
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is only needed for BankerState
+    np = None
+
+
+def safe_order(available, allocation, need):
     """
-    Safety Algorithm:
-    Check if the system is in a safe state.
+    Safety Algorithm (worklist form):
+    Return the safe sequence as process indices, or None if unsafe.
+
+    Each process counts the resources it is still blocked on, and each
+    resource keeps its blocked processes sorted by need. When a process
+    finishes, only the queues of the resources it releases are popped,
+    so the check costs O(n*m log n) instead of O(n^2*m).
+
+    The order is the same as the classic round-by-round scan: processes
+    are taken in index order within a round, and one that becomes ready
+    behind the scan waits for the next round.
     """
-    work = available.copy()
-    finish = [False] * processes
-    safe_sequence = []
+    n, m = len(allocation), len(available)
+    work = list(available)
+    blocked = [0] * n
+    queues = [[] for _ in range(m)]     # Per resource: (need, process), largest need first
 
-    while True:
-        allocated_this_round = False
+    for i in range(n):
+        row = need[i]
+        for j in range(m):
+            if row[j] > work[j]:
+                blocked[i] += 1
+                queues[j].append((row[j], i))
+    for q in queues:
+        q.sort(reverse=True)
 
-        for i in range(processes):
-            if not finish[i] and all(need[i][j] <= work[j] for j in range(len(work))):
-                # Pretend allocation
-                for j in range(len(work)):
-                    work[j] += allocation[i][j]  # Release resources after execution
+    this_round = [i for i in range(n) if blocked[i] == 0]   # Already sorted
+    next_round = []
+    sequence = []
 
-                safe_sequence.append(f"P{i}")
-                finish[i] = True
-                allocated_this_round = True
+    while this_round:
+        while this_round:
+            i = heapq.heappop(this_round)
+            sequence.append(i)
 
-        if not allocated_this_round:
-            break
+            # Process i finishes and releases its allocation
+            row = allocation[i]
+            for j in range(m):
+                if row[j]:
+                    work[j] += row[j]
+                    q = queues[j]
+                    while q and q[-1][0] <= work[j]:
+                        k = q.pop()[1]
+                        blocked[k] -= 1
+                        if blocked[k] == 0:
+                            heapq.heappush(this_round if k > i else next_round, k)
 
-    if all(finish):
-        return True, safe_sequence
-    else:
+        this_round, next_round = next_round, []
+
+    return sequence if len(sequence) == n else None
+
+
+def is_safe(processes, available, maximum, allocation, need):
+    """
+    Safety Algorithm:
+    Check if the system is in a safe state.
+    """
+    order = safe_order(available, allocation[:processes], need[:processes])
+    if order is None:
         return False, []
+    return True, [f"P{i}" for i in order]
 
 
 def request_resources(process_id, request, available, allocation, need, maximum):
@@ -85,6 +129,303 @@ def request_resources(process_id, request, available, allocation, need, maximum)
         return False
 
 
+# -------------------------------------------------------------------------
+# Matrix-backed state (NumPy)
+# -------------------------------------------------------------------------
+GRANTED = "granted"
+WAIT = "wait"               # Not enough available right now
+UNSAFE = "unsafe"           # Would leave the system unsafe
+
+
+class BankerState:
+    """
+    Banker's state held as int64 matrices.
+
+    A request is applied in place as a trial and rolled back if the new
+    state is unsafe, so a request costs O(m) plus the safety check
+    instead of copying every matrix.
+
+    The last safe sequence is cached with the work vector in front of
+    each of its steps (work[t] = available + allocations of the first t
+    processes). When process p at position k gets request r, work drops
+    by r for positions 0..k and is unchanged after k, where p hands r
+    back. Position k itself still passes (its need dropped by r too), so
+    only the processes before p are re-checked against work - r. Only
+    when one of them fails is the full safety check run. Releases keep
+    the cached order valid.
+    """
+
+    def __init__(self, available, maximum, allocation):
+        if np is None:
+            raise ImportError("BankerState requires NumPy")
+        self.available = np.array(available, dtype=np.int64)
+        self.maximum = np.array(maximum, dtype=np.int64).reshape(-1, len(self.available))
+        self.allocation = np.array(allocation, dtype=np.int64).reshape(self.maximum.shape)
+        self.need = self.maximum - self.allocation
+        if (self.need < 0).any():
+            raise ValueError("allocation exceeds the maximum claim")
+
+        # Safe-sequence cache: order, position of each process in it,
+        # and the work vector in front of each step
+        self._order = None
+        self._position = None
+        self._work = None
+
+    @property
+    def processes(self):
+        return len(self.allocation)
+
+    def safe_order(self):
+        """
+        Safe sequence as process indices, or None if unsafe.
+
+        Same worklist as safe_order(). The setup is vectorized: the
+        (resource, need) pairs that block a process are found and sorted
+        once into one array. The walk itself is plain Python over lists,
+        since a finishing process usually unblocks only a few entries and
+        per-process NumPy calls would cost more than they save. Only the
+        resources somebody is blocked on are walked.
+        """
+        need, allocation = self.need, self.allocation
+        n, m = need.shape
+        available = self.available
+
+        # Key (resource j, need) as j * span + need, so one sorted array
+        # holds every resource's blocked processes in need order
+        span = int(max(need.max(initial=0), available.sum() + allocation.sum())) + 1
+        base = np.arange(m, dtype=np.int64) * span
+        who, res = np.nonzero(need > available)
+        blocked = np.bincount(who, minlength=n)     # Resources each process waits on
+        keys = base[res] + need[who, res]
+        order = np.argsort(keys, kind="stable")
+        keys, who = keys[order], who[order]
+        starts = np.searchsorted(keys, base)
+        ends = np.searchsorted(keys, base + span)
+
+        # Column c of the walk is resource cols[c]; limit[c] is its key
+        # for the current work, so entries with keys <= limit are released
+        cols = np.flatnonzero(ends > starts)
+        released, ends = starts[cols].tolist(), ends[cols].tolist()
+        limit = (base + available)[cols].tolist()
+        rows = allocation[:, cols].tolist()
+        keys, who = keys.tolist(), who.tolist()
+
+        this_round = np.flatnonzero(blocked == 0).tolist()
+        blocked = blocked.tolist()
+        next_round = []
+        sequence = []
+
+        while this_round:
+            while this_round:
+                i = heapq.heappop(this_round)
+                sequence.append(i)
+
+                # Process i finishes and releases its allocation
+                for c, held in enumerate(rows[i]):
+                    if held:
+                        limit[c] += held
+                        k, end = released[c], ends[c]
+                        while k < end and keys[k] <= limit[c]:
+                            p = who[k]
+                            blocked[p] -= 1
+                            if blocked[p] == 0:
+                                heapq.heappush(this_round if p > i else next_round, p)
+                            k += 1
+                        released[c] = k
+
+            this_round, next_round = next_round, []
+
+        return sequence if len(sequence) == n else None
+
+    def is_safe(self):
+        order = self.safe_order()
+        if order is None:
+            return False, []
+        return True, [f"P{i}" for i in order]
+
+    def request(self, process_id, request):
+        # Resource Request Algorithm; returns GRANTED, WAIT or UNSAFE
+        request = np.asarray(request, dtype=np.int64)
+        if (request > self.need[process_id]).any():
+            raise ValueError(f"P{process_id} has exceeded its maximum claim")
+        if (request > self.available).any():
+            return WAIT
+
+        if self._cache_allows(process_id, request):
+            self._move(process_id, request)
+            return GRANTED
+
+        # Trial allocation in place
+        self._move(process_id, request)
+        order = self.safe_order()
+        if order is not None:
+            self._cache(order)
+            return GRANTED
+        self._move(process_id, -request)        # Roll back
+        return UNSAFE
+
+    def grant(self, process_id, request):
+        # Commit a request already known to leave the state safe
+        request = np.asarray(request, dtype=np.int64)
+        if not self._cache_allows(process_id, request):
+            self._order = None
+        self._move(process_id, request)
+
+    def release(self, process_id, release):
+        release = np.asarray(release, dtype=np.int64)
+        if (release > self.allocation[process_id]).any():
+            raise ValueError(f"P{process_id} is releasing more than it holds")
+        self._move(process_id, -release)
+
+    def _cache(self, order):
+        order = np.asarray(order, dtype=np.int64)
+        work = np.empty((len(order), len(self.available)), dtype=np.int64)
+        if len(order):
+            work[0] = self.available
+            np.cumsum(self.allocation[order[:-1]], axis=0, out=work[1:])
+            work[1:] += self.available
+        self._order = order
+        self._position = np.empty_like(order)
+        self._position[order] = np.arange(len(order))
+        self._work = work
+
+    def _cache_allows(self, process_id, request):
+        # Does the cached sequence stay safe after granting `request`?
+        if self._order is None:
+            return False
+        k = self._position[process_id]
+        before = self._order[:k]
+        return bool((self.need[before] <= self._work[:k] - request).all())
+
+    def _move(self, process_id, amount):
+        # Hand `amount` from available to the process (negative: back).
+        # The cached work vectors up to the process's position follow.
+        self.available -= amount
+        self.allocation[process_id] += amount
+        self.need[process_id] -= amount
+        if self._order is not None:
+            self._work[:self._position[process_id] + 1] -= amount
+
+    def print_state(self):
+        print_state(self.available.tolist(), self.maximum.tolist(),
+                    self.allocation.tolist(), self.need.tolist())
+
+
+# -------------------------------------------------------------------------
+# Admission service: batches, concurrent callers, wait queue
+# -------------------------------------------------------------------------
+DENIED = "denied"           # Exceeds the process's maximum claim
+
+
+class Decision:
+    # Outcome of one request. A WAIT decision stays queued in the service
+    # and is updated in place once a release settles it; `wait()` blocks
+    # the submitter until then.
+
+    __slots__ = ("process_id", "request", "status", "reason", "settled")
+
+    def __init__(self, process_id, request, status=WAIT, reason=None):
+        self.process_id = process_id
+        self.request = request
+        self.status = status        # GRANTED, WAIT or DENIED
+        self.reason = reason        # Why not granted: WAIT, UNSAFE or DENIED
+        self.settled = threading.Event()
+
+    def _set(self, status, reason=None):
+        self.status = status
+        self.reason = reason
+        if status != WAIT:
+            self.settled.set()
+
+    def wait(self, timeout=None):
+        # Block until granted or denied; returns False on timeout
+        return self.settled.wait(timeout)
+
+    def __repr__(self):
+        why = f", {self.reason}" if self.reason else ""
+        return f"Decision(P{self.process_id}, {self.request.tolist()}, {self.status}{why})"
+
+
+class AdmissionService:
+    """
+    Thread-safe request admission around a BankerState.
+
+    Every call takes one lock, so concurrent callers see a consistent
+    state. Requests that cannot be granted now (not available, or
+    unsafe) join a wait queue that is re-evaluated on every release.
+
+    Fast path: if after the request every column of `available` still
+    covers the largest need in that column, every process can finish
+    right away, so the state is safe without running the safety check.
+    The column maxima are kept as an upper bound: grants only lower
+    needs, and releases raise the bound in O(m).
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.lock = threading.Lock()
+        self.waiting = deque()      # Decisions with status WAIT, oldest first
+        self.bound = state.need.max(axis=0, initial=0)
+
+    def _admit(self, decision):
+        state = self.state
+        process_id, request = decision.process_id, decision.request
+        if (request > state.need[process_id]).any():
+            decision._set(DENIED, DENIED)
+            return
+
+        after = state.available - request
+        if (after >= self.bound).all():
+            state.grant(process_id, request)
+            decision._set(GRANTED)
+            return
+
+        status = state.request(process_id, request)
+        if status == GRANTED:
+            decision._set(GRANTED)
+        else:
+            decision._set(WAIT, status)
+
+    def _admit_all(self, decisions):
+        # Greedy largest safe subset: smallest requests first, each one
+        # tried against the state left by the grants before it
+        for d in sorted(decisions, key=lambda d: int(d.request.sum())):
+            self._admit(d)
+
+    def submit(self, process_id, request):
+        return self.submit_batch([(process_id, request)])[0]
+
+    def submit_batch(self, requests):
+        """
+        Admit a batch of (process_id, request) pairs.
+
+        Returns one Decision per request, in input order; WAIT decisions
+        are queued until a release lets them through.
+        """
+        decisions = [Decision(pid, np.asarray(r, dtype=np.int64)) for pid, r in requests]
+        with self.lock:
+            self._admit_all(decisions)
+            self.waiting.extend(d for d in decisions if d.status == WAIT)
+        return decisions
+
+    def release(self, process_id, release):
+        """
+        Return resources, then retry the wait queue.
+
+        Queued decisions are updated in place (waking anyone blocked in
+        Decision.wait()); the ones settled by this release, granted or
+        denied, are also returned.
+        """
+        with self.lock:
+            self.state.release(process_id, release)
+            np.maximum(self.bound, self.state.need[process_id], out=self.bound)
+
+            queued = list(self.waiting)
+            self._admit_all(queued)
+            self.waiting = deque(d for d in queued if d.status == WAIT)
+            return [d for d in queued if d.status != WAIT]
+
+
 # -------------------------------------------------------------------------
 # Display function
 # -------------------------------------------------------------------------
@@ -147,3 +488,18 @@ if __name__ == "__main__":
 
     # Print state again
     print_state(available, maximum, allocation, need)
+
+    # Same request sequence on the matrix-backed state
+    if np is not None:
+        state = BankerState([3, 3, 2], maximum, [
+            [0, 1, 0], [2, 0, 0], [3, 0, 2], [2, 1, 1], [0, 0, 2]])
+        print("\nBankerState: P1 requests [1, 0, 2] ->", state.request(1, [1, 0, 2]))
+        print("BankerState: P4 requests [3, 3, 0] ->", state.request(4, [3, 3, 0]))
+        print("BankerState: P0 requests [0, 2, 0] ->", state.request(0, [0, 2, 0]))
+        print("Safe sequence:", " → ".join(state.is_safe()[1]))
+
+        # Batch admission with a wait queue
+        service = AdmissionService(state)
+        for d in service.submit_batch([(3, [0, 1, 1]), (4, [3, 3, 0]), (0, [8, 0, 0]), (2, [0, 0, 0])]):
+            print(d)
+        print("After P1 releases [3, 0, 2]:", service.release(1, [3, 0, 2]))
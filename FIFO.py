@@ -2,24 +2,22 @@
 # FIFO Page Replacement Algorithm - Python Implementation
 # -----------------------------------------------------------
 
-def fifo_page_replacement(pages, frames):
-    memory = []
-    page_faults = 0
-    pointer = 0   # Points to next frame to replace
+from replacement_policies import FIFOFrames, run_replacement
 
-    print("FIFO Page Replacement:")
 
-    for p in pages:
-        if p not in memory:
-            page_faults += 1
+def fifo_page_replacement(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # quiet=True: no printing, returns a ReplacementReport (faults, hit
+    # ratio, faults per window, evictions per page) instead of the count.
+    # hook(i, page, fault, memory) runs on every sample_every-th reference.
+    engine = FIFOFrames(frames)
+
+    if quiet:
+        return run_replacement(engine, pages, True, window, hook, sample_every)
 
-            if len(memory) < frames:
-                memory.append(p)
-            else:
-                memory[pointer] = p
-                pointer = (pointer + 1) % frames
+    print("FIFO Page Replacement:")
 
-        print(f"Page: {p} --> Memory: {memory}")
+    page_faults = run_replacement(engine, pages, False, window, hook, sample_every,
+                                  echo="Page: {p} --> Memory: {memory}")
 
     print("\nTotal Page Faults (FIFO):", page_faults)
     return page_faults
@@ -2,27 +2,22 @@
 # LRU Page Replacement Algorithm - Python Implementation
 # -----------------------------------------------------------
 
-def lru_page_replacement(pages, frames):
-    memory = []
-    page_faults = 0
-    last_used = {}   # Track last used times for each page
+from replacement_policies import LRUFrames, run_replacement
 
-    print("LRU Page Replacement:")
 
-    for time, p in enumerate(pages):
-        if p not in memory:
-            page_faults += 1
+def lru_page_replacement(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # quiet=True: no printing, returns a ReplacementReport (faults, hit
+    # ratio, faults per window, evictions per page) instead of the count.
+    # hook(i, page, fault, memory) runs on every sample_every-th reference.
+    engine = LRUFrames(frames)
+
+    if quiet:
+        return run_replacement(engine, pages, True, window, hook, sample_every)
 
-            if len(memory) < frames:
-                memory.append(p)
-            else:
-                # Find least recently used page
-                lru_page = min(last_used, key=last_used.get)
-                memory[memory.index(lru_page)] = p
-                del last_used[lru_page]
+    print("LRU Page Replacement:")
 
-        last_used[p] = time
-        print(f"Page: {p} --> Memory: {memory}")
+    page_faults = run_replacement(engine, pages, False, window, hook, sample_every,
+                                  echo="Page: {p} --> Memory: {memory}")
 
     print("\nTotal Page Faults (LRU):", page_faults)
     return page_faults
@@ -0,0 +1,203 @@
+# -------------------------------------------------------------------
+# Page Replacement Comparison Driver
+# Every policy x frame size x trace, in parallel
+# -------------------------------------------------------------------
+# Traces are shared with the worker processes as memory-mapped binary
+# files (see page_trace.py): a worker gets only a path and opens the
+# file with mmap, so a 50M-reference trace is never pickled.
+#
+# LRU is a stack algorithm, so one stack-distance pass per trace gives
+# its faults for every frame size at once; the other policies run one
+# cell per (policy, frames, trace). Optimal's next-use array is built
+# once per trace by the driver and written next to the trace in the
+# same binary format, so the workers map it instead of each building
+# their own copy.
+#
+# The output is one fault table plus a check for Belady's anomaly under
+# FIFO (more frames, more faults).
+# -------------------------------------------------------------------
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from page_trace import TraceReader, write_trace
+from replacement_policies import (ARCFrames, ClockFrames, FIFOFrames, LFUFrames,
+                                  OptimalFrames, TwoQFrames, next_uses)
+from stack_distance import lru_fault_curve
+
+POLICIES = ("FIFO", "LRU", "Optimal", "CLOCK", "LFU", "ARC", "2Q")
+
+ENGINES = {
+    "FIFO": FIFOFrames,
+    "CLOCK": ClockFrames,
+    "LFU": LFUFrames,
+    "ARC": ARCFrames,
+    "2Q": TwoQFrames,
+}
+
+
+# ---------------- Worker side ----------------
+_traces = {}        # path -> open TraceReader
+
+NEXT_SUFFIX = ".next"
+
+
+def _trace(path):
+    if path not in _traces:
+        _traces[path] = TraceReader(path)
+    return _traces[path]
+
+
+def write_next_uses(path):
+    # Next-use indices of a trace, as a trace of 8-byte numbers next to it
+    with TraceReader(path) as pages:
+        nxt = next_uses(pages)
+    write_trace(path + NEXT_SUFFIX, nxt, width=8)
+    return path + NEXT_SUFFIX
+
+
+def _next_uses(path):
+    # Mapped next-use file if the driver wrote one, else built here
+    if os.path.exists(path + NEXT_SUFFIX):
+        return _trace(path + NEXT_SUFFIX)
+    return next_uses(_trace(path))
+
+
+def count_faults(policy, path, frames):
+    # Faults of one policy on one trace with `frames` frames
+    pages = _trace(path)
+    if policy == "Optimal":
+        engine = OptimalFrames(frames)
+        return sum(map(engine.access, pages, _next_uses(path)))
+    engine = ENGINES[policy](frames)
+    return sum(map(engine.access, pages))
+
+
+def run_cell(cell):
+    policy, path, frame_sizes = cell
+    if policy == "LRU":
+        curve = lru_fault_curve(_trace(path), max(frame_sizes))
+        return [(policy, path, k, curve[k - 1]) for k in frame_sizes]
+    return [(policy, path, k, count_faults(policy, path, k)) for k in frame_sizes]
+
+
+# ---------------- Driver ----------------
+def compare(traces, frame_sizes, policies=POLICIES, workers=None):
+    """
+    Fault counts for every policy x frame size x trace.
+
+    `traces` maps a name to a binary trace path or to a list of pages
+    (lists are written to temporary trace files first). Returns rows of
+    {"trace", "policy", "frames", "references", "faults", "fault_rate"}.
+    """
+    frame_sizes = sorted(set(frame_sizes))
+    temp = []
+    paths = {}
+    for name, trace in traces.items():
+        if isinstance(trace, (str, os.PathLike)):
+            paths[name] = os.fspath(trace)
+        else:
+            fd, path = tempfile.mkstemp(suffix=".pgtr")
+            os.close(fd)
+            write_trace(path, trace, width=8)
+            temp.append(path)
+            paths[name] = path
+
+    # LRU covers all frame sizes in one pass; other policies get one cell each
+    cells = []
+    for policy in policies:
+        for path in paths.values():
+            if policy == "LRU":
+                cells.append((policy, path, frame_sizes))
+            else:
+                cells.extend((policy, path, [k]) for k in frame_sizes)
+
+    try:
+        if "Optimal" in policies:
+            for path in paths.values():
+                temp.append(write_next_uses(path))
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            results = [run_cell(cell) for cell in cells]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run_cell, cells))
+
+        lengths = {}
+        for path in paths.values():
+            with TraceReader(path) as reader:
+                lengths[path] = len(reader)
+    finally:
+        for path in temp:
+            if path in _traces:
+                _traces.pop(path).close()
+            if os.path.exists(path):
+                os.remove(path)
+
+    names = {path: name for name, path in paths.items()}
+    rows = []
+    for chunk in results:
+        for policy, path, frames, faults in chunk:
+            n = lengths[path]
+            rows.append({
+                "trace": names[path],
+                "policy": policy,
+                "frames": frames,
+                "references": n,
+                "faults": faults,
+                "fault_rate": faults / n if n else 0.0,
+            })
+    rows.sort(key=lambda r: (r["trace"], POLICIES.index(r["policy"]), r["frames"]))
+    return rows
+
+
+def belady_anomalies(rows, policy="FIFO"):
+    # (trace, fewer frames, their faults, more frames, their faults)
+    # wherever adding frames increased the fault count
+    anomalies = []
+    by_trace = {}
+    for r in rows:
+        if r["policy"] == policy:
+            by_trace.setdefault(r["trace"], []).append((r["frames"], r["faults"]))
+    for trace, points in by_trace.items():
+        points.sort()
+        for (k1, f1), (k2, f2) in zip(points, points[1:]):
+            if f2 > f1:
+                anomalies.append((trace, k1, f1, k2, f2))
+    return anomalies
+
+
+def print_table(rows):
+    traces = sorted({r["trace"] for r in rows})
+    policies = [p for p in POLICIES if any(r["policy"] == p for r in rows)]
+    faults = {(r["trace"], r["policy"], r["frames"]): r["faults"] for r in rows}
+
+    for trace in traces:
+        frames = sorted({r["frames"] for r in rows if r["trace"] == trace})
+        print(f"\nTrace: {trace}")
+        print("Frames | " + " | ".join(f"{p:>8}" for p in policies))
+        print("-" * (9 + 11 * len(policies)))
+        for k in frames:
+            print(f"{k:>6} | " + " | ".join(f"{faults.get((trace, p, k), '-'):>8}" for p in policies))
+
+
+# -------------------------------------------------------------------
+# Main Program (Sample run)
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    traces = {
+        "textbook": [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3],
+        "belady": [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5],
+    }
+
+    rows = compare(traces, range(1, 6))
+    print_table(rows)
+
+    print("\nBelady's anomaly (FIFO):")
+    anomalies = belady_anomalies(rows)
+    for trace, k1, f1, k2, f2 in anomalies:
+        print(f"  {trace}: {k1} frames -> {f1} faults, {k2} frames -> {f2} faults")
+    if not anomalies:
+        print("  none")
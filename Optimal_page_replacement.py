@@ -2,33 +2,22 @@
 # OPTIMAL Page Replacement Algorithm - Python Implementation
 # -----------------------------------------------------------
 
-def optimal_page_replacement(pages, frames):
-    memory = []
-    page_faults = 0
+from replacement_policies import OptimalFrames, run_replacement
 
-    print("Optimal Page Replacement:")
-
-    for i, p in enumerate(pages):
-        if p not in memory:
-            page_faults += 1
 
-            if len(memory) < frames:
-                memory.append(p)
-            else:
-                # Find farthest future use
-                future_index = {}
+def optimal_page_replacement(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # quiet=True: no printing, returns a ReplacementReport (faults, hit
+    # ratio, faults per window, evictions per page) instead of the count.
+    # hook(i, page, fault, memory) runs on every sample_every-th reference.
+    engine = OptimalFrames(frames, pages)
 
-                for m in memory:
-                    if m in pages[i+1:]:
-                        future_index[m] = pages[i+1:].index(m)
-                    else:
-                        future_index[m] = float('inf')
+    if quiet:
+        return run_replacement(engine, pages, True, window, hook, sample_every)
 
-                # Replace the page used farthest in future
-                page_to_replace = max(future_index, key=future_index.get)
-                memory[memory.index(page_to_replace)] = p
+    print("Optimal Page Replacement:")
 
-        print(f"Page: {p} --> Memory: {memory}")
+    page_faults = run_replacement(engine, pages, False, window, hook, sample_every,
+                                  echo="Page: {p} --> Memory: {memory}")
 
     print("\nTotal Page Faults (Optimal):", page_faults)
     return page_faults
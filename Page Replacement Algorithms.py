@@ -1,101 +1,85 @@
 # -------------------------------------------------------------------
 # Page Replacement Algorithms in Python
-# FIFO, LRU, Optimal
+# FIFO, LRU, Optimal, CLOCK (Second-Chance), LFU, ARC, 2Q
 # Compare page faults
 # -------------------------------------------------------------------
 
-def fifo(pages, frames):
-    memory = []
-    page_faults = 0
-    pointer = 0  # Points to next frame to replace
+from replacement_policies import (ARCFrames, ClockFrames, FIFOFrames, LFUFrames,
+                                  LRUFrames, OptimalFrames, TwoQFrames,
+                                  run_replacement)
 
-    for p in pages:
-        if p not in memory:
-            page_faults += 1
+# Every policy below takes the same arguments:
+#   quiet=True      no per-reference printing; returns a ReplacementReport
+#                   (faults, hit ratio, faults per window, evictions per page)
+#                   instead of the bare fault count
+#   window          references per point of the fault time series
+#   hook, sample_every
+#                   hook(i, page, fault, memory) on every sample_every-th reference
 
-            if len(memory) < frames:
-                memory.append(p)
-            else:
-                memory[pointer] = p
-                pointer = (pointer + 1) % frames
 
-        # Debug printing (optional)
-        print(f"Page: {p} -> Memory: {memory}")
+def fifo(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # Pointer ring over the frames, O(1) membership via a dict
+    return run_replacement(FIFOFrames(frames), pages, quiet, window, hook, sample_every)
 
-    return page_faults
 
+def lru(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # O(1) hits and evictions
+    return run_replacement(LRUFrames(frames), pages, quiet, window, hook, sample_every)
 
-def lru(pages, frames):
-    memory = []
-    page_faults = 0
 
-    last_used = {}  # Track usage time
+def optimal(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # Next-use index of every reference, precomputed in one backward pass
+    return run_replacement(OptimalFrames(frames, pages), pages, quiet, window, hook, sample_every)
 
-    for time, p in enumerate(pages):
-        if p not in memory:
-            page_faults += 1
 
-            if len(memory) < frames:
-                memory.append(p)
-            else:
-                # Find least recently used page
-                lru_page = min(last_used, key=last_used.get)
-                memory[memory.index(lru_page)] = p
-                del last_used[lru_page]
+def clock(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # CLOCK / Second-Chance: FIFO ring with a reference bit per frame
+    return run_replacement(ClockFrames(frames), pages, quiet, window, hook, sample_every)
 
-        last_used[p] = time
 
-        print(f"Page: {p} -> Memory: {memory}")
+def lfu(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # O(1) LFU with frequency buckets; ties go to the least recently used
+    return run_replacement(LFUFrames(frames), pages, quiet, window, hook, sample_every)
 
-    return page_faults
 
+def arc(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # Adaptive Replacement Cache: balances recency and frequency
+    return run_replacement(ARCFrames(frames), pages, quiet, window, hook, sample_every)
 
-def optimal(pages, frames):
-    memory = []
-    page_faults = 0
 
-    for i, p in enumerate(pages):
-        if p not in memory:
-            page_faults += 1
+def two_q(pages, frames, quiet=False, window=1000, hook=None, sample_every=1):
+    # 2Q: FIFO probation queue + ghost list in front of an LRU main list
+    return run_replacement(TwoQFrames(frames), pages, quiet, window, hook, sample_every)
 
-            if len(memory) < frames:
-                memory.append(p)
-            else:
-                # Find page with farthest next use
-                future_use = {}
 
-                for m in memory:
-                    if m in pages[i+1:]:
-                        future_use[m] = pages[i+1:].index(m)
-                    else:
-                        future_use[m] = float('inf')
-
-                page_to_replace = max(future_use, key=future_use.get)
-                memory[memory.index(page_to_replace)] = p
-
-        print(f"Page: {p} -> Memory: {memory}")
-
-    return page_faults
+ALGORITHMS = {
+    "FIFO": fifo,
+    "LRU": lru,
+    "Optimal": optimal,
+    "CLOCK": clock,
+    "LFU": lfu,
+    "ARC": arc,
+    "2Q": two_q,
+}
 
 
 # -------------------------------------------------------------------
 # Compare algorithms
 # -------------------------------------------------------------------
-def compare_algorithms(pages, frames):
-    print("\n--- FIFO ---")
-    fifo_faults = fifo(pages, frames)
-
-    print("\n--- LRU ---")
-    lru_faults = lru(pages, frames)
-
-    print("\n--- OPTIMAL ---")
-    opt_faults = optimal(pages, frames)
+def compare_algorithms(pages, frames, quiet=False):
+    results = {}
+    for name, algorithm in ALGORITHMS.items():
+        if quiet:
+            results[name] = algorithm(pages, frames, quiet=True).faults
+        else:
+            print(f"\n--- {name.upper()} ---")
+            results[name] = algorithm(pages, frames)
 
     print("\n==================== RESULTS ====================")
-    print(f"Total Page Faults (FIFO):    {fifo_faults}")
-    print(f"Total Page Faults (LRU):     {lru_faults}")
-    print(f"Total Page Faults (Optimal): {opt_faults}")
+    for name, faults in results.items():
+        print(f"{'Total Page Faults (' + name + '):':<29}{faults}")
     print("=================================================")
+    return results
 
 
 # -------------------------------------------------------------------
@@ -2,41 +2,37 @@
 # PRIORITY SCHEDULING (PREEMPTIVE)
 # ----------------------------------------------------
 
-def priority_preemptive(processes):
-    procs = [p.copy() for p in processes]
-    for p in procs:
-        p["remaining"] = p["burst"]
-
-    time = 0
-    completed = 0
-    n = len(procs)
-    gantt = []
-    last_pid = None
-
-    while completed < n:
-        ready = [p for p in procs if p["arrival"] <= time and p["remaining"] > 0]
+from preemptive_engine import run_preemptive
+from process_table import ProcessTable
 
-        if not ready:
-            time += 1
-            continue
 
-        # Lowest priority number first
-        ready.sort(key=lambda x: x["priority"])
-        current = ready[0]
-
-        if last_pid != current["pid"]:
-            gantt.append({"pid": current["pid"], "start": time})
-            last_pid = current["pid"]
+def priority_preemptive(processes):
+    if isinstance(processes, ProcessTable):
+        # Results go straight into the table's columns
+        start, completion, gantt = run_preemptive(
+            processes.arrival,
+            processes.burst,
+            processes.priority,
+            pids=processes.pid,
+        )
+        processes.set_results(start, completion)
+        return processes, gantt
 
-        current["remaining"] -= 1
-        time += 1
+    procs = [p.copy() for p in processes]
 
-        if current["remaining"] == 0:
-            current["completion"] = time
-            completed += 1
+    # Lowest priority number first; the engine jumps between
+    # arrivals and completions instead of ticking one unit at a time
+    _, completion, gantt = run_preemptive(
+        [p["arrival"] for p in procs],
+        [p["burst"] for p in procs],
+        [p["priority"] for p in procs],
+        pids=[p["pid"] for p in procs],
+    )
 
     # Calculate metrics
-    for p in procs:
+    for p, c in zip(procs, completion):
+        p["remaining"] = 0
+        p["completion"] = c
         p["turnaround"] = p["completion"] - p["arrival"]
         p["waiting"] = p["turnaround"] - p["burst"]
 
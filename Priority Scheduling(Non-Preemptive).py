@@ -2,33 +2,68 @@
 # PRIORITY SCHEDULING (NON-PREEMPTIVE)
 # ----------------------------------------------------
 
-def priority_non_preemptive(processes):
-    procs = [p.copy() for p in processes]
-    n = len(procs)
+import heapq
+
+from process_table import ProcessTable
+
+
+def priority_schedule(arrival, burst, priority):
+    # Core scheduler over parallel columns.
+    # Returns (dispatch order, start time per process).
+    n = len(arrival)
+    start = [0] * n
+    dispatched = []
     time = 0
-    completed = 0
-    result = []
 
-    while completed < n:
-        ready = [p for p in procs if p["arrival"] <= time and "done" not in p]
+    # Cursor over processes in arrival order
+    order = sorted(range(n), key=arrival.__getitem__)
+    nxt = 0
+
+    # Min-heap of ready processes: lowest number = highest priority,
+    # ties broken by arrival, then input order
+    ready = []
+
+    while len(dispatched) < n:
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (priority[i], arrival[i], i))
+            nxt += 1
 
         if not ready:
-            time += 1
+            # CPU idle: jump straight to the next arrival
+            time = arrival[order[nxt]]
             continue
 
-        # Lowest number = highest priority
-        ready.sort(key=lambda x: x["priority"])
-        current = ready[0]
+        i = heapq.heappop(ready)[2]
+        start[i] = time
+        time += burst[i]
+        dispatched.append(i)
 
-        current["start"] = time
-        time += current["burst"]
-        current["completion"] = time
+    return dispatched, start
+
+
+def priority_non_preemptive(processes):
+    if isinstance(processes, ProcessTable):
+        # Results go straight into the table's columns
+        _, start = priority_schedule(processes.arrival, processes.burst,
+                                     processes.priority)
+        processes.set_results(start, [s + b for s, b in zip(start, processes.burst)])
+        return processes
+
+    procs = [p.copy() for p in processes]
+    dispatched, start = priority_schedule([p["arrival"] for p in procs],
+                                          [p["burst"] for p in procs],
+                                          [p["priority"] for p in procs])
+
+    result = []
+    for i in dispatched:
+        current = procs[i]
+        current["start"] = start[i]
+        current["completion"] = current["start"] + current["burst"]
         current["turnaround"] = current["completion"] - current["arrival"]
         current["waiting"] = current["turnaround"] - current["burst"]
         current["done"] = True
-
         result.append(current)
-        completed += 1
 
     return result
 
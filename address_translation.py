@@ -0,0 +1,301 @@
+# -------------------------------------------------------------------
+# Address translation: TLB + multi-level page table + physical frames
+# -------------------------------------------------------------------
+# Virtual addresses are split into a virtual page number (VPN) and one
+# index per page-table level, e.g. 4 KiB pages with 4 levels of 9 bits
+# on a 48-bit address space (x86-64):
+#
+#   | L0 idx | L1 idx | L2 idx | L3 idx | offset |
+#     9 bits   9 bits   9 bits   9 bits   12 bits
+#
+# Every reference goes through
+#   1. the TLB: `tlb_sets` sets of `tlb_ways` entries, one replacement
+#      engine per set (set = VPN mod tlb_sets);
+#   2. on a TLB miss, a page walk (one memory access per level);
+#   3. the physical frames: one replacement engine over all VPNs.
+# When a page is evicted from its frame, its TLB entry is invalidated
+# (discarded from its set), and the next TLB fill in that set reuses
+# the freed way.
+#
+# Addresses are processed in NumPy batches: the split is vectorized and
+# runs of references to the same page collapse to one engine call (the
+# repeats are guaranteed TLB and frame hits under FIFO, LRU and OPT).
+# Without NumPy the same thing is done in plain Python.
+# -------------------------------------------------------------------
+
+from array import array
+from itertools import islice
+
+from replacement_policies import FIFOFrames, LRUFrames, OptimalFrames, next_uses
+
+try:
+    import numpy as np
+except ImportError:     # Plain Python fallback
+    np = None
+
+POLICIES = {
+    "FIFO": FIFOFrames,
+    "LRU": LRUFrames,
+    "Optimal": OptimalFrames,
+}
+
+BATCH = 1 << 20
+
+
+def default_level_bits(address_bits, page_size, levels):
+    # Split the VPN bits evenly over the levels; the top levels take
+    # the leftover bits
+    offset_bits = page_size.bit_length() - 1
+    vpn_bits = address_bits - offset_bits
+    base, extra = divmod(vpn_bits, levels)
+    return tuple(base + (1 if l < extra else 0) for l in range(levels))
+
+
+def page_numbers(addresses, page_size, vpn_bits=64):
+    # VPN of every address (NumPy uint64 array, or a list without NumPy)
+    if page_size <= 0 or page_size & (page_size - 1):
+        raise ValueError("page_size must be a power of two")
+    offset_bits = page_size.bit_length() - 1
+
+    if np is not None:
+        vpn = np.asarray(addresses, dtype=np.uint64) >> np.uint64(offset_bits)
+        wide = vpn_bits < 64 and vpn.size and int(vpn.max()) >> vpn_bits
+    else:
+        vpn = [a >> offset_bits for a in addresses]
+        wide = vpn and max(vpn) >> vpn_bits
+    if wide:
+        raise ValueError(f"address wider than {offset_bits + vpn_bits} bits")
+    return vpn
+
+
+def split_addresses(addresses, page_size, level_bits):
+    """
+    Split virtual addresses into (vpn, indices).
+
+    `indices[l]` holds the page-table index used at level l (0 = root).
+    With NumPy the result is arrays; otherwise lists.
+    """
+    vpn = page_numbers(addresses, page_size, sum(level_bits))
+    indices = []
+    shift = sum(level_bits)
+    for bits in level_bits:
+        shift -= bits
+        mask = (1 << bits) - 1
+        if np is not None:
+            indices.append((vpn >> np.uint64(shift)) & np.uint64(mask))
+        else:
+            indices.append([(v >> shift) & mask for v in vpn])
+    return vpn, indices
+
+
+def _batches(addresses, size):
+    if hasattr(addresses, "chunks"):                # page_trace.TraceReader
+        yield from addresses.chunks(size)
+    elif hasattr(addresses, "__len__") and hasattr(addresses, "__getitem__"):
+        for start in range(0, len(addresses), size):
+            yield addresses[start:start + size]
+    else:
+        it = iter(addresses)
+        while True:
+            batch = list(islice(it, size))
+            if not batch:
+                return
+            yield batch
+
+
+class TranslationReport:
+    __slots__ = ("references", "tlb_hits", "walks", "walk_accesses", "faults", "table_pages")
+
+    def __init__(self, references, tlb_hits, walks, walk_accesses, faults, table_pages):
+        self.references = references
+        self.tlb_hits = tlb_hits
+        self.walks = walks                  # TLB misses, each one walks the table
+        self.walk_accesses = walk_accesses  # Memory accesses spent walking
+        self.faults = faults                # Page faults (physical frames)
+        self.table_pages = table_pages      # Page-table pages per level
+
+    @property
+    def tlb_hit_rate(self):
+        return self.tlb_hits / self.references if self.references else 0.0
+
+    @property
+    def fault_rate(self):
+        return self.faults / self.references if self.references else 0.0
+
+    def __repr__(self):
+        return (f"TranslationReport(references={self.references}, "
+                f"tlb_hit_rate={self.tlb_hit_rate:.4f}, walks={self.walks}, "
+                f"faults={self.faults})")
+
+
+class AddressTranslator:
+    def __init__(self, page_size=4096, address_bits=48, levels=4, level_bits=None,
+                 tlb_sets=16, tlb_ways=4, tlb_policy="LRU",
+                 frames=1024, frame_policy="LRU"):
+        for policy in (tlb_policy, frame_policy):
+            if policy not in POLICIES:
+                raise ValueError(f"unknown policy {policy!r}, expected one of {tuple(POLICIES)}")
+        self.page_size = page_size
+        self.level_bits = tuple(level_bits or default_level_bits(address_bits, page_size, levels))
+        self.tlb_sets = tlb_sets
+        self.tlb_ways = tlb_ways
+        self.tlb_policy = tlb_policy
+        self.frames = frames
+        self.frame_policy = frame_policy
+
+    # ---------------- Splitting and run collapsing ----------------
+    def _runs(self, batch, last):
+        # VPNs of the batch with consecutive repeats collapsed; a run
+        # continuing the previous batch's last page is dropped too.
+        # Returns (run vpns, repeated references, last vpn).
+        vpn = page_numbers(batch, self.page_size, sum(self.level_bits))
+        n = len(vpn)
+        if n == 0:
+            return [], 0, last
+
+        if np is not None:
+            keep = np.empty(n, dtype=bool)
+            keep[0] = last is None or int(vpn[0]) != last
+            np.not_equal(vpn[1:], vpn[:-1], out=keep[1:])
+            runs = vpn[keep].tolist()
+            return runs, n - len(runs), int(vpn[-1])
+
+        runs = []
+        for v in vpn:
+            if v != last:
+                runs.append(v)
+                last = v
+        return runs, n - len(runs), last
+
+    def _count_tables(self, runs, tables):
+        # Distinct page-table pages per level: a level-l table is named
+        # by the VPN bits above its index
+        shift = sum(self.level_bits)
+        if np is not None:
+            vpns = np.unique(np.asarray(runs, dtype=np.uint64))
+        else:
+            vpns = set(runs)
+        for l, bits in enumerate(self.level_bits):
+            shift -= bits
+            prefix = shift + bits
+            if np is not None:
+                tables[l].update(np.unique(vpns >> np.uint64(prefix)).tolist() if prefix < 64 else [0])
+            else:
+                tables[l].update({v >> prefix for v in vpns})
+
+    # ---------------- Engine passes ----------------
+    def _pass(self, engine, sets, runs, nxt):
+        # Frames and TLB together over the collapsed VPNs (FIFO/LRU TLB).
+        # Returns (faults, TLB misses).
+        access = engine.access
+        count = self.tlb_sets
+        faults = misses = 0
+        for i, v in enumerate(runs):
+            if access(v) if nxt is None else access(v, nxt[i]):
+                faults += 1
+                victim = engine.evicted
+                if victim is not None:
+                    sets[victim % count].discard(victim)    # Invalidate its TLB entry
+            if sets[v % count].access(v):
+                misses += 1
+        return faults, misses
+
+    def _frame_pass(self, engine, runs, nxt):
+        # Frames only: fault bitmap and the page evicted at each fault
+        access = engine.access
+        faults = bytearray(len(runs))
+        evictions = {}      # Reference -> victim page
+        for i, v in enumerate(runs):
+            if access(v) if nxt is None else access(v, nxt[i]):
+                faults[i] = 1
+                if engine.evicted is not None:
+                    evictions[i] = engine.evicted
+        return faults, evictions
+
+    def _tlb_pass(self, sets, runs, faults, evictions, nxt):
+        # OPT TLB after _frame_pass; returns the number of misses. An
+        # entry is next used at the page's next reference, unless that
+        # reference faults (the page, and its entry, went in between).
+        n = len(runs)
+        count = self.tlb_sets
+        misses = 0
+        for i, v in enumerate(runs):
+            victim = evictions.get(i)
+            if victim is not None:
+                sets[victim % count].discard(victim)
+            j = nxt[i]
+            if sets[v % count].access(v, j if j < n and not faults[j] else n):
+                misses += 1
+        return misses
+
+    # ---------------- Driver ----------------
+    def run(self, addresses, batch=BATCH):
+        """
+        Translate a trace of virtual addresses; returns a TranslationReport.
+
+        `addresses` may be a list, a NumPy array, any iterable or a
+        page_trace.TraceReader. With FIFO/LRU on both levels the trace
+        is streamed batch by batch; OPT needs the whole (collapsed) trace
+        to know next uses.
+        """
+        engine = POLICIES[self.frame_policy](self.frames)
+        sets = [POLICIES[self.tlb_policy](self.tlb_ways) for _ in range(self.tlb_sets)]
+        tables = [set() for _ in self.level_bits]
+        offline = "Optimal" in (self.frame_policy, self.tlb_policy)
+
+        references = misses = faults = 0
+        last = None
+        collected = array("Q")
+
+        for chunk in _batches(addresses, batch):
+            runs, repeated, last = self._runs(chunk, last)
+            references += len(runs) + repeated
+            self._count_tables(runs, tables)
+            if offline:
+                collected.extend(runs)
+                continue
+            f, m = self._pass(engine, sets, runs, None)
+            faults += f
+            misses += m
+
+        if offline:
+            nxt = next_uses(collected)
+            frame_nxt = nxt if self.frame_policy == "Optimal" else None
+            if self.tlb_policy == "Optimal":
+                fault_map, evictions = self._frame_pass(engine, collected, frame_nxt)
+                faults = sum(fault_map)
+                misses = self._tlb_pass(sets, collected, fault_map, evictions, nxt)
+            else:
+                faults, misses = self._pass(engine, sets, collected, frame_nxt)
+
+        levels = len(self.level_bits)
+        return TranslationReport(references, references - misses, misses,
+                                 misses * levels, faults, [len(t) for t in tables])
+
+
+def translate(addresses, **config):
+    # One-call form: translate(addresses, page_size=4096, frames=256, ...)
+    return AddressTranslator(**config).run(addresses)
+
+
+# -------------------------------------------------------------------
+# Example run
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(0)
+    # Sequential scans over a few arrays plus random lookups in a table
+    addresses = []
+    for _ in range(50):
+        base = rng.choice([0x10000000, 0x20000000, 0x7f0000000000])
+        addresses.extend(range(base, base + 64 * 1024, 64))
+        addresses.extend(0x30000000 + rng.randrange(1 << 24) for _ in range(200))
+
+    print(f"{len(addresses)} references")
+    print("TLB     | Frames  | TLB hit rate |   Walks | Faults")
+    for tlb in POLICIES:
+        for frames in POLICIES:
+            r = translate(addresses, tlb_sets=16, tlb_ways=4, tlb_policy=tlb,
+                          frames=256, frame_policy=frames)
+            print(f"{tlb:<7} | {frames:<7} | {r.tlb_hit_rate:>12.4f} | {r.walks:>7} | {r.faults:>6}")
@@ -0,0 +1,211 @@
+# ----------------------------------------------------
+# Benchmark suite for the CPU schedulers
+# ----------------------------------------------------
+# Generates reproducible (seeded) synthetic workloads, times every
+# scheduler on them and records throughput and peak memory as JSON:
+#
+#   python benchmark.py --sizes 100 10000 1000000 --out bench.json
+#   python benchmark.py --out new.json --compare bench.json
+#
+# Workloads: Poisson arrivals (exponential inter-arrival times scaled to
+# a target CPU load) with exponential, heavy-tailed (Pareto) or bimodal
+# burst lengths. They are built directly as ProcessTables, so even 10^7
+# processes fit comfortably in memory.
+# ----------------------------------------------------
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from process_table import ProcessTable
+from sweep import ALGORITHMS, get_scheduler, load_module
+
+DISTRIBUTIONS = ("exponential", "heavy_tailed", "bimodal")
+
+
+# ---------------- Workload generators ----------------
+def burst_sampler(distribution, rng, mean):
+    if distribution == "exponential":
+        return lambda: max(1, round(rng.expovariate(1 / mean)))
+    if distribution == "heavy_tailed":
+        # Pareto with alpha = 1.5 has mean = 3 * xmin
+        alpha = 1.5
+        xmin = mean * (alpha - 1) / alpha
+        return lambda: max(1, round(xmin * rng.paretovariate(alpha)))
+    if distribution == "bimodal":
+        # 90% short interactive jobs, 10% long batch jobs
+        short, long = mean / 5, mean * 8.2
+        return lambda: max(1, round(rng.gauss(short if rng.random() < 0.9 else long, short / 4)))
+    raise ValueError(f"unknown distribution {distribution!r}, expected one of {DISTRIBUTIONS}")
+
+
+def generate_workload(n, distribution="exponential", seed=0, mean_burst=20,
+                      load=0.9, priorities=10):
+    """
+    Seeded synthetic workload of n processes as a ProcessTable.
+
+    Arrivals are a Poisson process whose rate keeps the CPU busy a
+    fraction `load` of the time on average.
+    """
+    rng = random.Random(f"{distribution}:{n}:{seed}")
+    next_burst = burst_sampler(distribution, rng, mean_burst)
+    gap = mean_burst / load
+
+    arrival = array("q", bytes(8 * n))
+    burst = array("q", bytes(8 * n))
+    priority = array("q", bytes(8 * n))
+    t = 0.0
+    for i in range(n):
+        t += rng.expovariate(1 / gap)
+        arrival[i] = int(t)
+        burst[i] = next_burst()
+        priority[i] = rng.randint(1, priorities)
+
+    return ProcessTable(array("q", range(n)), arrival, burst, priority)
+
+
+# ---------------- Timing ----------------
+REPEAT = 7          # Timed repeats per cell at most, best one kept
+MIN_TIME = 0.02     # Shortest timed repeat: small tables loop until they reach it
+MAX_TIME = 3.0      # Timed seconds per cell before repeats are cut down
+
+
+def best_time(fn, args, repeat=REPEAT):
+    # Best of several repeats, like timeit.repeat with autorange: one run
+    # of a small table is mostly timer noise, so it is looped; a large
+    # table that takes seconds per run gets fewer repeats.
+    # Returns (seconds per call, repeats).
+    t0 = time.perf_counter()
+    fn(*args)                                   # Warm-up, also sizes the loop
+    first = time.perf_counter() - t0
+    number = max(1, math.ceil(MIN_TIME / first)) if first > 0 else 1000
+    repeats = max(1, min(repeat, int(MAX_TIME / (max(first, 1e-9) * number))))
+    best = first if number == 1 else math.inf
+    for _ in range(repeats - (number == 1)):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn(*args)
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best, repeats
+
+
+def benchmark_one(algorithm, table, quantum, memory=True, repeat=REPEAT):
+    scheduler = get_scheduler(algorithm)
+    args = (table, quantum) if ALGORITHMS[algorithm][3] else (table,)
+
+    seconds, repeats = best_time(scheduler, args, repeat)
+
+    result = {
+        "algorithm": algorithm,
+        "seconds": seconds,
+        "repeats": repeats,
+        "throughput": len(table) / seconds if seconds > 0 else math.inf,
+    }
+
+    # Second run under tracemalloc: tracing slows Python down, so it is
+    # kept out of the timed run
+    if memory:
+        tracemalloc.start()
+        scheduler(*args)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result
+
+
+def benchmark_fcfs_numpy(table, memory=True, repeat=REPEAT):
+    fcfs_numpy = load_module("fcfs.py").fcfs_numpy
+    arrival, burst = table.arrival, table.burst
+
+    seconds, repeats = best_time(fcfs_numpy, (arrival, burst), repeat)
+
+    result = {
+        "algorithm": "fcfs_numpy",
+        "seconds": seconds,
+        "repeats": repeats,
+        "throughput": len(table) / seconds if seconds > 0 else math.inf,
+    }
+    if memory:
+        tracemalloc.start()
+        fcfs_numpy(arrival, burst)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run_benchmarks(sizes=(100, 1000, 10000), distributions=DISTRIBUTIONS,
+                   algorithms=None, seed=0, quantum=4, memory=True, verbose=True,
+                   repeat=REPEAT):
+    has_numpy = load_module("fcfs.py").np is not None
+    results = []
+
+    for distribution in distributions:
+        for n in sizes:
+            table = generate_workload(n, distribution, seed)
+            runs = [benchmark_one(a, table, quantum, memory, repeat)
+                    for a in algorithms or ALGORITHMS]
+            if has_numpy and not algorithms:
+                runs.append(benchmark_fcfs_numpy(table, memory, repeat))
+
+            for r in runs:
+                r.update(distribution=distribution, size=n, seed=seed,
+                         quantum=quantum if r["algorithm"] == "round_robin" else None)
+                results.append(r)
+                if verbose:
+                    peak = f"{r['peak_bytes'] / 2**20:9.1f} MiB" if "peak_bytes" in r else ""
+                    print(f"{distribution:<13} {n:>9} {r['algorithm']:<20} "
+                          f"{r['seconds']:9.4f} s {r['throughput']:14,.0f} proc/s {peak}")
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare(old, new, threshold=1.2):
+    # Runs that got slower than `threshold` times the old timing
+    key = lambda r: (r["distribution"], r["size"], r["algorithm"], r.get("quantum"))
+    before = {key(r): r for r in old["results"]}
+    regressions = []
+    for r in new["results"]:
+        o = before.get(key(r))
+        if o and o["seconds"] > 0 and r["seconds"] / o["seconds"] > threshold:
+            regressions.append((key(r), o["seconds"], r["seconds"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the CPU schedulers")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quantum", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="timed repeats per cell (fewer for slow cells); the best is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--compare", help="earlier JSON results to check for regressions")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.distributions, args.algorithms,
+                            args.seed, args.quantum, not args.no_memory, repeat=args.repeat)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report)
+        print(f"\n{len(regressions)} regression(s)")
+        for k, old_s, new_s in regressions:
+            print(f"  {k}: {old_s:.4f} s -> {new_s:.4f} s")
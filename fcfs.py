@@ -2,7 +2,72 @@
 # FCFS CPU Scheduling (Non-preemptive)
 # -------------------------------------------
 
+from process_table import ProcessTable
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is only needed for fcfs_numpy()
+    np = None
+
+
+def fcfs_table(table):
+    # Same schedule on a ProcessTable; rows keep their order and the
+    # results are written into the table's result columns
+    order = sorted(range(len(table)), key=table.arrival.__getitem__)
+    arrival, burst = table.arrival, table.burst
+
+    current_time = 0
+    for i in order:
+        if current_time < arrival[i]:
+            current_time = arrival[i]
+
+        table.start[i] = current_time
+        current_time += burst[i]
+        table.completion[i] = current_time
+        table.turnaround[i] = current_time - arrival[i]
+        table.waiting[i] = table.turnaround[i] - burst[i]
+
+    return table
+
+
+def fcfs_numpy(arrival, burst):
+    # Vectorized FCFS over whole arrays. Inputs are left untouched;
+    # returns (start, completion, turnaround, waiting) in input order.
+    #
+    # In arrival order, completion[i] = max(completion[i-1], arrival[i]) + burst[i],
+    # which unrolls to  completion[i] = B[i] + max(0, max_{j<=i}(arrival[j] - B[j-1]))
+    # with B the running sum of bursts: one cumsum plus one running max.
+    if np is None:
+        raise ImportError("fcfs_numpy() requires NumPy")
+
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+
+    # Arrival logs are usually sorted already; skip the argsort then
+    if np.all(arrival[1:] >= arrival[:-1]):
+        order = slice(None)
+    else:
+        order = np.argsort(arrival, kind="stable")
+    a = arrival[order]
+    b = burst[order]
+
+    total = np.cumsum(b)
+    slack = a - (total - b)
+    np.maximum.accumulate(slack, out=slack)
+    np.maximum(slack, 0, out=slack)
+
+    completion = np.empty_like(total)
+    completion[order] = total + slack
+    start = completion - burst
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    return start, completion, turnaround, waiting
+
+
 def fcfs(processes):
+    if isinstance(processes, ProcessTable):
+        return fcfs_table(processes)
+
     # Sort by arrival time
     processes.sort(key=lambda x: x['arrival'])
 
@@ -20,6 +85,32 @@ def fcfs(processes):
     return processes
 
 
+def fcfs_stream(jobs):
+    # Streaming FCFS over an arrival-ordered iterator of job dicts.
+    # Yields ("segment", {"pid", "start", "end"}) and ("completion", job)
+    # as soon as each is final; nothing but the current job is kept.
+    current_time = 0
+    last_arrival = None
+    for job in jobs:
+        if last_arrival is not None and job['arrival'] < last_arrival:
+            raise ValueError("fcfs_stream() needs jobs in arrival order")
+        last_arrival = job['arrival']
+
+        p = job.copy()
+        if current_time < p['arrival']:
+            current_time = p['arrival']
+
+        p['start'] = current_time
+        current_time += p['burst']
+        p['completion'] = current_time
+        p['turnaround'] = p['completion'] - p['arrival']
+        p['waiting'] = p['turnaround'] - p['burst']
+
+        if p['burst'] > 0:
+            yield "segment", {"pid": p['pid'], "start": p['start'], "end": p['completion']}
+        yield "completion", p
+
+
 if __name__ == "__main__":
     processes = [
         {"pid": "P1", "arrival": 0, "burst": 5},
@@ -0,0 +1,96 @@
+# ----------------------------------------------------
+# Compact run-length Gantt chart
+# ----------------------------------------------------
+# Segments are kept in three parallel array('q') columns
+# (process index, start, end); adjacent runs of the same process are
+# merged as they are added. Process indices point into `pids`, usually
+# the pid column of the workload, so no label is stored per segment.
+#
+#   chart.who_ran_at(7)     # -> pid running at t=7 (None if idle), O(log n)
+#   chart.segments()        # -> (pid, start, end) tuples
+#   chart.segment_count     # -> number of merged segments
+#   for g in chart: ...     # -> today's {"pid", "start"} dicts, built lazily
+#   chart[0], len(chart)    # -> indexing and length follow the dicts,
+#                           #    like the list the schedulers used to return
+# ----------------------------------------------------
+
+from array import array
+from bisect import bisect_right
+
+
+class Gantt:
+    __slots__ = ("pids", "index", "start", "end", "_switches")
+
+    def __init__(self, pids):
+        self.pids = pids
+        self.index = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self._switches = None   # Segments that start a dict entry, built on demand
+
+    def add(self, i, start, end):
+        # Record that process i ran on [start, end)
+        if end <= start:
+            return
+        self._switches = None
+        if self.index and self.index[-1] == i and self.end[-1] == start:
+            self.end[-1] = end
+        else:
+            self.index.append(i)
+            self.start.append(start)
+            self.end.append(end)
+
+    @property
+    def segment_count(self):
+        return len(self.index)
+
+    def _entries(self):
+        # Segment numbers where the CPU switches to another pid
+        if self._switches is None:
+            pids = self.pids
+            switches = array("q")
+            last_pid = None
+            for k, i in enumerate(self.index):
+                if pids[i] != last_pid:
+                    switches.append(k)
+                    last_pid = pids[i]
+            self._switches = switches
+        return self._switches
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __getitem__(self, k):
+        entries = self._entries()
+        if isinstance(k, slice):
+            return [self._entry(s) for s in entries[k]]
+        return self._entry(entries[k])
+
+    def _entry(self, s):
+        return {"pid": self.pids[self.index[s]], "start": self.start[s]}
+
+    def who_ran_at(self, t):
+        k = bisect_right(self.start, t) - 1
+        if k >= 0 and t < self.end[k]:
+            return self.pids[self.index[k]]
+        return None
+
+    def segments(self):
+        pids = self.pids
+        for i, s, e in zip(self.index, self.start, self.end):
+            yield pids[i], s, e
+
+    def __iter__(self):
+        # Today's format: one entry each time the CPU switches to another
+        # pid (an idle gap alone does not start a new entry)
+        last_pid = None
+        for pid, s, _ in self.segments():
+            if pid != last_pid:
+                yield {"pid": pid, "start": s}
+                last_pid = pid
+
+    def to_dicts(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"Gantt({self.segment_count} segments)"
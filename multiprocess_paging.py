@@ -0,0 +1,232 @@
+# -------------------------------------------------------------------
+# Paging for many processes sharing one pool of physical frames
+# -------------------------------------------------------------------
+# The trace interleaves references from many processes as (pid, page)
+# pairs (two binary traces can be paired up with zip(pids, pages)).
+# Three ways to share the frames:
+#
+#   GlobalPaging   one FIFO/LRU engine over all frames, keyed by
+#                  (pid, page): a fault may evict any process's page
+#   LocalPaging    one engine per process with a fixed quota: a fault
+#                  only evicts the faulting process's own pages
+#   PFFPaging      local replacement whose quotas follow each process's
+#                  page-fault frequency: a process faulting often gets
+#                  frames from the free pool, one faulting rarely gives
+#                  frames back
+#
+# Every structure is a hash (pid -> engine, pid -> counters), so a
+# reference costs O(1) whatever the number of processes.
+# -------------------------------------------------------------------
+
+from replacement_policies import FIFOFrames, LRUFrames
+
+POLICIES = {
+    "FIFO": FIFOFrames,
+    "LRU": LRUFrames,
+}
+
+
+def _engine(policy):
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {tuple(POLICIES)}")
+    return POLICIES[policy]
+
+
+def resized(engine, frames):
+    # Same policy with a different number of frames, keeping the pages
+    # that would be evicted last
+    if isinstance(engine, LRUFrames):
+        order = list(engine.slots)                  # Least recently used first
+    elif len(engine.memory) == engine.frames:
+        m, k = engine.memory, engine.pointer        # Oldest page at the pointer
+        order = m[k:] + m[:k]
+    else:
+        order = list(engine.memory)
+    new = type(engine)(frames)
+    for p in order[max(len(order) - frames, 0):] if frames else ():
+        new.access(p)
+    return new
+
+
+class GlobalPaging:
+    def __init__(self, frames, policy="LRU"):
+        self.engine = _engine(policy)(frames)
+        self.frames = frames
+        self.rss = {}               # pid -> resident pages
+
+    def access(self, pid, page):
+        engine = self.engine
+        if not engine.access((pid, page)):
+            return False
+        rss = self.rss
+        rss[pid] = rss.get(pid, 0) + 1
+        victim = engine.evicted
+        if victim is not None:
+            rss[victim[0]] -= 1
+        return True
+
+    def resident(self):
+        return dict(self.rss)
+
+    def quotas(self):
+        return None
+
+
+class LocalPaging:
+    def __init__(self, quota, policy="LRU", quotas=None):
+        # `quota` frames per process, or quotas[pid] where given
+        self.quota = quota
+        self.overrides = quotas or {}
+        self.make = _engine(policy)
+        self.engines = {}
+
+    def _admit(self, pid):
+        engine = self.engines[pid] = self.make(self.overrides.get(pid, self.quota))
+        return engine
+
+    def access(self, pid, page):
+        engine = self.engines.get(pid)
+        if engine is None:
+            engine = self._admit(pid)
+        return engine.access(page)
+
+    def resident(self):
+        return {pid: len(e) for pid, e in self.engines.items()}
+
+    def quotas(self):
+        return {pid: e.frames for pid, e in self.engines.items()}
+
+
+class PFFPaging(LocalPaging):
+    """
+    Page-fault-frequency allocation (Chu and Opderbeck).
+
+    Every `window` references of a process its fault rate is checked:
+    above `upper` the process gets `step` more frames (if the pool has
+    any free), below `lower` it gives `step` frames back (down to
+    `min_quota`). New processes start with `initial` frames, taken from
+    the largest process when the pool is empty.
+    """
+
+    def __init__(self, frames, policy="LRU", initial=4, window=100,
+                 upper=0.10, lower=0.02, step=1, min_quota=1):
+        super().__init__(initial, policy)
+        self.frames = frames
+        self.free = frames
+        self.window = window
+        self.upper = upper
+        self.lower = lower
+        self.step = step
+        self.min_quota = min_quota
+        self.state = {}             # pid -> [references left in window, faults in window]
+        self.grown = self.shrunk = 0
+
+    def _admit(self, pid):
+        want = min(self.quota, self.free)
+        if want == 0:
+            # Pool exhausted: take a frame from the largest process
+            donor = max(self.engines, key=lambda p: self.engines[p].frames, default=None)
+            if donor is None or self.engines[donor].frames <= self.min_quota:
+                raise ValueError(f"no free frame for process {pid!r} "
+                                 f"({self.frames} frames, {len(self.engines)} processes)")
+            self._set_quota(donor, self.engines[donor].frames - 1)
+            want = 1
+        self.free -= want
+        engine = self.engines[pid] = self.make(want)
+        self.state[pid] = [self.window, 0]
+        return engine
+
+    def _set_quota(self, pid, frames):
+        engine = self.engines[pid]
+        self.free += engine.frames - frames
+        self.engines[pid] = resized(engine, frames)
+
+    def access(self, pid, page):
+        engine = self.engines.get(pid)
+        if engine is None:
+            engine = self._admit(pid)
+        fault = engine.access(page)
+
+        state = self.state[pid]
+        if fault:
+            state[1] += 1
+        state[0] -= 1
+        if state[0] == 0:
+            rate = state[1] / self.window
+            if rate > self.upper and self.free:
+                self._set_quota(pid, engine.frames + min(self.step, self.free))
+                self.grown += 1
+            elif rate < self.lower and engine.frames > self.min_quota:
+                self._set_quota(pid, max(engine.frames - self.step, self.min_quota))
+                self.shrunk += 1
+            state[0] = self.window
+            state[1] = 0
+        return fault
+
+
+class PagingReport:
+    __slots__ = ("references", "faults", "resident", "quotas")
+
+    def __init__(self, references, faults, resident, quotas):
+        self.references = references    # pid -> references
+        self.faults = faults            # pid -> page faults
+        self.resident = resident        # pid -> resident pages at the end
+        self.quotas = quotas            # pid -> frames at the end (None for global)
+
+    @property
+    def total_references(self):
+        return sum(self.references.values())
+
+    @property
+    def total_faults(self):
+        return sum(self.faults.values())
+
+    def fault_rate(self, pid=None):
+        if pid is None:
+            n = self.total_references
+            return self.total_faults / n if n else 0.0
+        return self.faults.get(pid, 0) / self.references[pid]
+
+    def __repr__(self):
+        return (f"PagingReport(processes={len(self.references)}, "
+                f"references={self.total_references}, faults={self.total_faults})")
+
+
+def run_paging(paging, trace):
+    # Drive a GlobalPaging / LocalPaging / PFFPaging over (pid, page) pairs
+    access = paging.access
+    references = {}
+    faults = {}
+    for pid, page in trace:
+        references[pid] = references.get(pid, 0) + 1
+        if access(pid, page):
+            faults[pid] = faults.get(pid, 0) + 1
+    return PagingReport(references, faults, paging.resident(), paging.quotas())
+
+
+# -------------------------------------------------------------------
+# Example run
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(0)
+    # Process 0 has a large working set, 1-3 small ones
+    spans = {0: 40, 1: 6, 2: 6, 3: 3}
+    trace = []
+    for _ in range(20000):
+        pid = rng.randrange(4)
+        trace.append((pid, rng.randrange(spans[pid])))
+
+    frames = 48
+    runs = {
+        "global": GlobalPaging(frames),
+        "local": LocalPaging(frames // 4),
+        "PFF": PFFPaging(frames, initial=frames // 4),
+    }
+    for name, paging in runs.items():
+        report = run_paging(paging, trace)
+        print(f"{name:<6} faults={report.total_faults:<5} "
+              f"fault rate={report.fault_rate():.3f} "
+              f"resident={dict(sorted(report.resident.items()))} "
+              f"quotas={report.quotas and dict(sorted(report.quotas.items()))}")
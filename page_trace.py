@@ -0,0 +1,216 @@
+# -------------------------------------------------------------------
+# Compact binary page-reference traces
+# -------------------------------------------------------------------
+# File layout (little endian):
+#
+#   offset 0   4 bytes  magic b"PGTR"
+#   offset 4   uint16   format version (1)
+#   offset 6   uint16   bytes per page number (4 or 8)
+#   offset 8   uint64   number of references
+#   offset 16  ...      page numbers, uint32 or uint64
+#
+# TraceReader maps the file with mmap and exposes the page numbers as a
+# memoryview, so a billion-reference trace costs 4-8 GB of page cache
+# instead of ~36 GB of Python ints, and nothing is copied. Iterating a
+# reader walks it chunk by chunk, so every page replacement function
+# that loops over `pages` accepts one directly.
+#
+#   convert_text_trace("trace.txt", "trace.pgtr")
+#   with TraceReader("trace.pgtr") as pages:
+#       lru(pages, 64)
+# -------------------------------------------------------------------
+
+import mmap
+import re
+import struct
+import sys
+from array import array
+
+MAGIC = b"PGTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ")
+TYPECODES = {4: "I", 8: "Q"}
+CHUNK = 1 << 16
+
+
+def _typecode(width):
+    if width not in TYPECODES:
+        raise ValueError("page numbers must be 4 or 8 bytes wide")
+    code = TYPECODES[width]
+    if array(code).itemsize != width:
+        raise ValueError(f"no native {width}-byte unsigned type on this platform")
+    return code
+
+
+def write_trace(path, pages, width=4):
+    # Write an iterable of page numbers; returns the number written
+    code = _typecode(width)
+    count = 0
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, width, 0))
+        buf = array(code)
+        for p in pages:
+            buf.append(p)
+            if len(buf) == CHUNK:
+                count += _flush(f, buf)
+        count += _flush(f, buf)
+
+        # Patch the reference count into the header
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, width, count))
+    return count
+
+
+def _flush(f, buf):
+    n = len(buf)
+    if sys.byteorder == "big":
+        buf.byteswap()
+    buf.tofile(f)
+    del buf[:]
+    return n
+
+
+def _parse(token):
+    # Decimal (leading zeros allowed) or 0x-prefixed hex
+    if token[:2] in ("0x", "0X"):
+        return int(token, 16)
+    return int(token, 10)
+
+
+def _read_text(path, column):
+    # Page numbers from a text trace: every integer token, or one CSV
+    # column (by index) per line. Blank lines and "#" comments are
+    # skipped, and so is a header on the first line; any other bad or
+    # missing field is an error rather than a silently dropped reference.
+    split = re.compile(r"[,\s;]+")
+    first = True
+    with open(path) as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = [x for x in split.split(line) if x]
+            if column is not None:
+                fields = fields[column:column + 1]
+                if not fields:
+                    raise ValueError(f"{path}:{lineno}: no column {column}")
+            if first and not fields[0][0].isdigit():
+                first = False
+                continue                # Header
+            first = False
+            for x in fields:
+                try:
+                    yield _parse(x)
+                except ValueError:
+                    raise ValueError(f"{path}:{lineno}: bad page number {x!r}") from None
+
+
+def convert_text_trace(src, dst, width=4, column=None):
+    """
+    Convert a text or CSV trace into the binary format.
+
+    Numbers may be decimal or 0x-prefixed hex. With `column` set, only
+    that CSV field of each line is used. Returns the reference count.
+    """
+    return write_trace(dst, _read_text(src, column), width)
+
+
+class TraceReader:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:          # Empty file
+            self._file.close()
+            raise ValueError(f"{path}: not a page trace (file is empty)")
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path}: not a page trace (file too short)")
+        magic, version, width, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: not a page trace (bad magic {magic!r})")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: unsupported trace version {version}")
+        if width not in TYPECODES or len(self._map) < HEADER.size + count * width:
+            self.close()
+            raise ValueError(f"{path}: truncated or corrupt page trace")
+
+        self.path = path
+        self.width = width
+        self._count = count
+        raw = memoryview(self._map)[HEADER.size:HEADER.size + count * width]
+        self._raw = raw
+        # Zero-copy on little-endian hosts; big-endian ones byteswap per chunk
+        self._view = raw.cast(_typecode(width)) if sys.byteorder == "little" else None
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if self._view is not None:
+            return self._view[i]
+        if isinstance(i, slice):
+            return self._swapped(*i.indices(self._count)[:2])
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("trace index out of range")
+        return int.from_bytes(self._raw[i * self.width:(i + 1) * self.width], "little")
+
+    def _swapped(self, start, stop):
+        buf = array(_typecode(self.width))
+        buf.frombytes(self._raw[start * self.width:stop * self.width])
+        buf.byteswap()
+        return buf
+
+    def chunks(self, size=CHUNK):
+        # Consecutive slices of at most `size` page numbers
+        for start in range(0, self._count, size):
+            stop = min(start + size, self._count)
+            yield self._view[start:stop] if self._view is not None else self._swapped(start, stop)
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def close(self):
+        try:
+            for name in ("_view", "_raw"):
+                view = getattr(self, name, None)
+                if view is not None:
+                    view.release()
+            if not self._map.closed:
+                self._map.close()
+        except BufferError:
+            # Chunks are still referenced somewhere; the map is released
+            # once they are garbage collected
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"TraceReader({self.path!r}, {self._count} references)"
+
+
+# -------------------------------------------------------------------
+# Example run
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    pages = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3]
+    path = os.path.join(tempfile.gettempdir(), "example.pgtr")
+
+    write_trace(path, pages)
+    with TraceReader(path) as trace:
+        print(trace, list(trace))
+    os.remove(path)
@@ -0,0 +1,78 @@
+# ----------------------------------------------------
+# Event-driven engine for PREEMPTIVE CPU Scheduling
+# (shared by SJF preemptive / SRTF and Priority preemptive)
+# ----------------------------------------------------
+# Instead of advancing the clock one unit at a time, the engine
+# jumps straight to the next event: either the next arrival or the
+# completion of the running process. The ready set is a min-heap,
+# so every decision costs O(log n).
+# ----------------------------------------------------
+
+import heapq
+
+from gantt import Gantt
+
+
+def run_preemptive(arrival, burst, priority=None, pids=None):
+    """
+    Simulate a preemptive scheduler over parallel columns.
+
+    If `priority` is None the ready process with the smallest remaining
+    time runs (SRTF), otherwise the one with the smallest priority number.
+    Ties go to the process that comes first in the input, exactly like the
+    stable sort the tick-by-tick versions used.
+
+    Returns (start, completion, chart): first dispatch and completion
+    time per process, and a Gantt chart labelled with `pids`.
+    """
+    n = len(arrival)
+    order = sorted(range(n), key=lambda i: arrival[i])
+    remaining = list(burst)
+    start = [-1] * n
+    completion = [0] * n
+    chart = Gantt(pids)
+
+    ready = []      # (remaining or priority, index)
+    nxt = 0         # Cursor into arrival order
+    time = 0
+    current = -1    # Index of the running process (-1 = CPU idle)
+
+    def rank(i):
+        return remaining[i] if priority is None else priority[i]
+
+    while nxt < n or ready or current >= 0:
+        # Admit everything that has arrived by now
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (rank(i), i))
+            nxt += 1
+
+        # Running process competes again with its updated key
+        if current >= 0:
+            heapq.heappush(ready, (rank(current), current))
+            current = -1
+
+        if not ready:
+            # CPU idle: jump straight to the next arrival
+            time = max(time, arrival[order[nxt]])
+            continue
+
+        _, current = heapq.heappop(ready)
+        if start[current] < 0:
+            start[current] = time
+
+        # Run until completion or the next arrival, whichever is first
+        run = remaining[current]
+        if nxt < n:
+            run = min(run, arrival[order[nxt]] - time)
+
+        chart.add(current, time, time + run)
+        remaining[current] -= run
+        time += run
+
+        if remaining[current] == 0:
+            completion[current] = time
+            current = -1
+
+    return start, completion, chart
+
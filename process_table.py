@@ -0,0 +1,127 @@
+# ----------------------------------------------------
+# Columnar process table shared by the CPU schedulers
+# ----------------------------------------------------
+# A list of dicts costs a few hundred bytes per process. ProcessTable
+# keeps one typed array per field instead (8 bytes per value), and
+# hands out light row views only when someone asks for a row.
+#
+#   table = ProcessTable.from_dicts(processes)
+#   fcfs(table)             # results are written into the table
+#   table[0].completion     # -> row view
+#   table.to_dicts()        # -> back to today's format
+# ----------------------------------------------------
+
+from array import array
+
+
+INPUT_COLUMNS = ("arrival", "burst", "priority")
+RESULT_COLUMNS = ("start", "completion", "turnaround", "waiting")
+
+
+def _int_column(values):
+    return values if isinstance(values, array) else array("q", values)
+
+
+def _pid_column(values):
+    # Integer pids fit in an array, anything else (e.g. "P1") stays a list
+    if isinstance(values, array):
+        return values
+    values = list(values)
+    if all(type(v) is int for v in values):
+        return array("q", values)
+    return values
+
+
+class ProcessRow:
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, key):
+        return getattr(self.table, key)[self.index]
+
+    def __setitem__(self, key, value):
+        getattr(self.table, key)[self.index] = value
+
+    def __getattr__(self, key):
+        if key in ("pid",) + INPUT_COLUMNS + RESULT_COLUMNS:
+            return getattr(self.table, key)[self.index]
+        raise AttributeError(key)
+
+    def as_dict(self):
+        return self.table.row_dict(self.index)
+
+    def __repr__(self):
+        return f"ProcessRow({self.as_dict()})"
+
+
+class ProcessTable:
+    def __init__(self, pid, arrival, burst, priority=None):
+        self.pid = _pid_column(pid)
+        self.arrival = _int_column(arrival)
+        self.burst = _int_column(burst)
+        n = len(self.arrival)
+
+        if len(self.pid) != n or len(self.burst) != n:
+            raise ValueError("pid, arrival and burst columns must have the same length")
+
+        self.has_priority = priority is not None
+        self.priority = _int_column(priority) if priority is not None else array("q", bytes(8 * n))
+
+        # Result columns, filled in by the schedulers
+        for name in RESULT_COLUMNS:
+            setattr(self, name, array("q", bytes(8 * n)))
+
+    # ---------------- Conversion ----------------
+    @classmethod
+    def from_dicts(cls, processes):
+        has_priority = bool(processes) and all("priority" in p for p in processes)
+        return cls(
+            [p["pid"] for p in processes],
+            [p["arrival"] for p in processes],
+            [p["burst"] for p in processes],
+            [p["priority"] for p in processes] if has_priority else None,
+        )
+
+    def row_dict(self, i):
+        row = {"pid": self.pid[i], "arrival": self.arrival[i], "burst": self.burst[i]}
+        if self.has_priority:
+            row["priority"] = self.priority[i]
+        for name in RESULT_COLUMNS:
+            row[name] = getattr(self, name)[i]
+        return row
+
+    def to_dicts(self):
+        return [self.row_dict(i) for i in range(len(self))]
+
+    # ---------------- Row access ----------------
+    def __len__(self):
+        return len(self.arrival)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("process index out of range")
+        return ProcessRow(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ProcessRow(self, i)
+
+    def set_results(self, start, completion):
+        # Fill all result columns from start/completion times
+        for i in range(len(self)):
+            self.start[i] = start[i]
+            self.completion[i] = completion[i]
+            self.turnaround[i] = completion[i] - self.arrival[i]
+            self.waiting[i] = self.turnaround[i] - self.burst[i]
+
+
+def to_process_table(processes):
+    # Converter for today's list-of-dicts workloads
+    if isinstance(processes, ProcessTable):
+        return processes
+    return ProcessTable.from_dicts(processes)
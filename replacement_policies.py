@@ -0,0 +1,553 @@
+# -------------------------------------------------------------------
+# Page replacement engines
+# -------------------------------------------------------------------
+# Each engine models `frames` physical frames and is driven one
+# reference at a time:
+#
+#   engine = LRUFrames(3)
+#   fault = engine.access(page)   # True on a page fault
+#   engine.evicted                # page evicted by the last fault (or None)
+#   engine.memory                 # frame contents, slot by slot
+#   engine.discard(page)          # drop a page without a fault (FIFO,
+#                                 # LRU, CLOCK, Optimal); the next fault
+#                                 # refills its frame before evicting
+#
+# `memory` has the same slot layout as the simple list-based versions
+# (a new page takes the victim's slot), so printed frame contents and
+# final memory match them exactly.
+# -------------------------------------------------------------------
+
+import heapq
+from array import array
+from collections import OrderedDict
+
+
+class FIFOFrames:
+    # First In First Out: a pointer walks the frames as a ring; a dict of
+    # page -> slot replaces the O(frames) membership scan
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.memory = []
+        self.slots = {}
+        self.free = []            # Slots emptied by discard()
+        self.pointer = 0          # Next frame to replace
+        self.evicted = None
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory) - len(self.free)
+
+    def discard(self, page):
+        slot = self.slots.pop(page, None)
+        if slot is not None:
+            self.memory[slot] = None
+            self.free.append(slot)
+
+    def access(self, page):
+        if page in self.slots:
+            return False
+
+        if len(self.memory) < self.frames:
+            slot = len(self.memory)
+            self.memory.append(page)
+            self.evicted = None
+        elif self.free:
+            slot = self.free.pop()
+            self.memory[slot] = page
+            self.evicted = None
+        else:
+            slot = self.pointer
+            self.evicted = self.memory[slot]
+            del self.slots[self.evicted]
+            self.memory[slot] = page
+            self.pointer = (slot + 1) % self.frames
+
+        self.slots[page] = slot
+        return True
+
+
+class LRUFrames:
+    # Least Recently Used: an OrderedDict of page -> slot kept in
+    # recency order, so hits and evictions are O(1)
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.memory = []
+        self.slots = OrderedDict()    # Least recently used first
+        self.free = []                # Slots emptied by discard()
+        self.evicted = None
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory) - len(self.free)
+
+    def discard(self, page):
+        slot = self.slots.pop(page, None)
+        if slot is not None:
+            self.memory[slot] = None
+            self.free.append(slot)
+
+    def access(self, page):
+        if page in self.slots:
+            self.slots.move_to_end(page)
+            return False
+
+        if len(self.memory) < self.frames:
+            slot = len(self.memory)
+            self.memory.append(page)
+            self.evicted = None
+        elif self.free:
+            slot = self.free.pop()
+            self.memory[slot] = page
+            self.evicted = None
+        else:
+            self.evicted, slot = self.slots.popitem(last=False)
+            self.memory[slot] = page
+
+        self.slots[page] = slot
+        return True
+
+
+class ClockFrames:
+    # CLOCK / Second-Chance: FIFO order kept as a ring with one reference
+    # bit per frame. The hand skips (and clears) referenced frames, so
+    # each reference costs O(1) amortized.
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.memory = []
+        self.referenced = []
+        self.slots = {}
+        self.free = []            # Slots emptied by discard()
+        self.hand = 0
+        self.evicted = None
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory) - len(self.free)
+
+    def discard(self, page):
+        slot = self.slots.pop(page, None)
+        if slot is not None:
+            self.memory[slot] = None
+            self.referenced[slot] = False
+            self.free.append(slot)
+
+    def access(self, page):
+        slot = self.slots.get(page)
+        if slot is not None:
+            self.referenced[slot] = True
+            return False
+
+        if len(self.memory) < self.frames:
+            slot = len(self.memory)
+            self.memory.append(page)
+            self.referenced.append(True)
+            self.evicted = None
+        elif self.free:
+            slot = self.free.pop()
+            self.memory[slot] = page
+            self.referenced[slot] = True
+            self.evicted = None
+        else:
+            # Give referenced pages a second chance
+            while self.referenced[self.hand]:
+                self.referenced[self.hand] = False
+                self.hand = (self.hand + 1) % self.frames
+            slot = self.hand
+            self.evicted = self.memory[slot]
+            del self.slots[self.evicted]
+            self.memory[slot] = page
+            self.referenced[slot] = True
+            self.hand = (slot + 1) % self.frames
+
+        self.slots[page] = slot
+        return True
+
+
+class LFUFrames:
+    # Least Frequently Used in O(1): pages live in per-frequency buckets
+    # (OrderedDicts, least recent first) and the lowest non-empty
+    # frequency is tracked, so no scan is ever needed. Ties between
+    # equally frequent pages go to the least recently used one.
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.memory = []
+        self.slots = {}
+        self.freq = {}              # page -> reference count
+        self.buckets = {}           # count -> OrderedDict of pages
+        self.min_freq = 0
+        self.evicted = None
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory)
+
+    def _bump(self, page, f):
+        # Move page from bucket f to f + 1
+        bucket = self.buckets[f]
+        del bucket[page]
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f:
+                self.min_freq = f + 1
+        self.freq[page] = f + 1
+        self.buckets.setdefault(f + 1, OrderedDict())[page] = None
+
+    def access(self, page):
+        f = self.freq.get(page)
+        if f is not None:
+            self._bump(page, f)
+            return False
+
+        if len(self.memory) < self.frames:
+            slot = len(self.memory)
+            self.memory.append(page)
+            self.evicted = None
+        else:
+            bucket = self.buckets[self.min_freq]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self.buckets[self.min_freq]
+            del self.freq[victim]
+            slot = self.slots.pop(victim)
+            self.evicted = victim
+            self.memory[slot] = page
+
+        self.slots[page] = slot
+        self.freq[page] = 1
+        self.buckets.setdefault(1, OrderedDict())[page] = None
+        self.min_freq = 1
+        return True
+
+
+class ARCFrames:
+    # Adaptive Replacement Cache (Megiddo & Modha). T1 holds pages seen
+    # once recently, T2 pages seen at least twice; B1/B2 remember pages
+    # recently evicted from each. Ghost hits move the target size p of T1,
+    # so the cache adapts between recency and frequency and resists scans.
+    # All lists are OrderedDicts (LRU first): O(1) per reference.
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.memory = []
+        self.slots = {}
+        self.t1, self.t2 = OrderedDict(), OrderedDict()
+        self.b1, self.b2 = OrderedDict(), OrderedDict()
+        self.p = 0
+        self.evicted = None
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory)
+
+    def _replace(self, in_b2):
+        # Evict from T1 or T2 into the matching ghost list
+        if self.t1 and ((in_b2 and len(self.t1) == self.p) or len(self.t1) > self.p):
+            victim, _ = self.t1.popitem(last=False)
+            self.b1[victim] = None
+        else:
+            victim, _ = self.t2.popitem(last=False)
+            self.b2[victim] = None
+        self.evicted = victim
+        return self.slots.pop(victim)
+
+    def access(self, page):
+        c = self.frames
+        if page in self.t1:
+            del self.t1[page]
+            self.t2[page] = None
+            return False
+        if page in self.t2:
+            self.t2.move_to_end(page)
+            return False
+
+        self.evicted = None
+        if page in self.b1:
+            self.p = min(c, self.p + max(len(self.b2) // len(self.b1), 1))
+            slot = self._replace(False)
+            del self.b1[page]
+            self.t2[page] = None
+        elif page in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            slot = self._replace(True)
+            del self.b2[page]
+            self.t2[page] = None
+        else:
+            slot = None
+            if len(self.t1) + len(self.b1) == c:
+                if len(self.t1) < c:
+                    self.b1.popitem(last=False)
+                    slot = self._replace(False)
+                else:
+                    victim, _ = self.t1.popitem(last=False)
+                    self.evicted = victim
+                    slot = self.slots.pop(victim)
+            elif len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) >= c:
+                if len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) == 2 * c:
+                    self.b2.popitem(last=False)
+                if len(self.t1) + len(self.t2) == c:
+                    slot = self._replace(False)
+            self.t1[page] = None
+
+        if slot is None:
+            slot = len(self.memory)
+            self.memory.append(page)
+        else:
+            self.memory[slot] = page
+        self.slots[page] = slot
+        return True
+
+
+class TwoQFrames:
+    # 2Q (Johnson & Shasha, full version). New pages enter A1in, a small
+    # FIFO; pages evicted from it are remembered in the ghost FIFO A1out.
+    # Only a page referenced again while in A1out is promoted to Am, the
+    # main LRU list, so one-off scans never flush the hot set.
+
+    def __init__(self, frames, kin=None, kout=None):
+        self.frames = frames
+        self.kin = kin if kin is not None else max(1, frames // 4)
+        self.kout = kout if kout is not None else max(1, frames // 2)
+        self.memory = []
+        self.slots = {}
+        self.a1in = OrderedDict()       # Oldest first
+        self.a1out = OrderedDict()      # Oldest first (ghosts)
+        self.am = OrderedDict()         # Least recently used first
+        self.evicted = None
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory)
+
+    def _reclaim(self):
+        # Free a frame: from A1in if it is over its share, else from Am
+        if len(self.a1in) > self.kin or not self.am:
+            victim, _ = self.a1in.popitem(last=False)
+            self.a1out[victim] = None
+            if len(self.a1out) > self.kout:
+                self.a1out.popitem(last=False)
+        else:
+            victim, _ = self.am.popitem(last=False)
+        self.evicted = victim
+        return self.slots.pop(victim)
+
+    def access(self, page):
+        if page in self.am:
+            self.am.move_to_end(page)
+            return False
+        if page in self.a1in:
+            return False
+
+        # Checked before reclaiming, which may push the page out of A1out
+        ghost = page in self.a1out
+        if len(self.memory) < self.frames:
+            slot = len(self.memory)
+            self.memory.append(page)
+            self.evicted = None
+        else:
+            slot = self._reclaim()
+            self.memory[slot] = page
+
+        if ghost:
+            self.a1out.pop(page, None)
+            self.am[page] = None
+        else:
+            self.a1in[page] = None
+        self.slots[page] = slot
+        return True
+
+
+def next_uses(pages):
+    # One backward pass: nxt[i] is the index of the next reference to
+    # pages[i], or len(pages) if it is never referenced again.
+    # Chunked sources (page_trace.TraceReader) are walked chunk by chunk.
+    n = len(pages)
+    nxt = array("q", bytes(8 * n))
+    seen = {}
+    chunks = list(pages.chunks()) if hasattr(pages, "chunks") else [pages]
+    i = n
+    for chunk in reversed(chunks):
+        for j in range(len(chunk) - 1, -1, -1):
+            i -= 1
+            p = chunk[j]
+            nxt[i] = seen.get(p, n)
+            seen[p] = i
+    return nxt
+
+
+class OptimalFrames:
+    # Belady's optimal replacement: evict the resident page whose next use
+    # is farthest away. Resident pages sit in a max-heap keyed by next
+    # use; entries made stale by later hits are skipped lazily.
+    # Ties (pages never used again) go to the lowest slot, like the
+    # list-based versions.
+
+    def __init__(self, frames, pages=None):
+        self.frames = frames
+        self.memory = []
+        self.slots = {}         # page -> slot
+        self.next_use = {}      # page -> index of its next reference
+        self.heap = []          # (-next use, slot, page)
+        self.free = []          # Slots emptied by discard()
+        self.evicted = None
+
+        # With the whole trace up front, access(page) looks up next uses
+        # itself; otherwise callers pass them in
+        self.upcoming = next_uses(pages) if pages is not None else None
+        self.time = 0
+
+    def __contains__(self, page):
+        return page in self.slots
+
+    def __len__(self):
+        return len(self.memory) - len(self.free)
+
+    def discard(self, page):
+        # Its heap entries go stale and are skipped like the others
+        slot = self.slots.pop(page, None)
+        if slot is not None:
+            del self.next_use[page]
+            self.memory[slot] = None
+            self.free.append(slot)
+
+    def access(self, page, next_use=None):
+        # `next_use` is the index of the next reference to `page`
+        # (see next_uses())
+        if next_use is None:
+            next_use = self.upcoming[self.time]
+            self.time += 1
+
+        fault = page not in self.slots
+        if fault:
+            if len(self.memory) < self.frames:
+                slot = len(self.memory)
+                self.memory.append(page)
+                self.evicted = None
+            elif self.free:
+                slot = self.free.pop()
+                self.memory[slot] = page
+                self.evicted = None
+            else:
+                slot = self._pop_victim()
+                self.memory[slot] = page
+            self.slots[page] = slot
+        else:
+            slot = self.slots[page]
+
+        self.next_use[page] = next_use
+        heapq.heappush(self.heap, (-next_use, slot, page))
+
+        # Stale entries pile up on hits; rebuild once they dominate
+        if len(self.heap) > 2 * self.frames + 64:
+            self.heap = [(-self.next_use[p], s, p) for p, s in self.slots.items()]
+            heapq.heapify(self.heap)
+        return fault
+
+    def _pop_victim(self):
+        while True:
+            neg_use, slot, page = heapq.heappop(self.heap)
+            if self.slots.get(page) == slot and self.next_use[page] == -neg_use:
+                del self.slots[page]
+                del self.next_use[page]
+                self.evicted = page
+                return slot
+
+
+# -------------------------------------------------------------------
+# Running an engine over a trace
+# -------------------------------------------------------------------
+class ReplacementReport:
+    # Structured result of a quiet run
+
+    __slots__ = ("references", "faults", "window", "fault_series", "evictions", "memory")
+
+    def __init__(self, references, faults, window, fault_series, evictions, memory):
+        self.references = references
+        self.faults = faults
+        self.window = window
+        self.fault_series = fault_series    # Faults per `window` references
+        self.evictions = evictions          # page -> times evicted
+        self.memory = memory                # Final frame contents
+
+    @property
+    def hits(self):
+        return self.references - self.faults
+
+    @property
+    def hit_ratio(self):
+        return self.hits / self.references if self.references else 0.0
+
+    def __repr__(self):
+        return (f"ReplacementReport(references={self.references}, faults={self.faults}, "
+                f"hit_ratio={self.hit_ratio:.4f})")
+
+
+def run_replacement(engine, pages, quiet=False, window=1000, hook=None,
+                    sample_every=1, echo="Page: {p} -> Memory: {memory}"):
+    """
+    Drive `engine` over `pages`.
+
+    quiet=False keeps the classic behaviour: print the frames after every
+    reference (formatted with `echo`) and return the fault count.
+    quiet=True prints nothing and returns a ReplacementReport with the
+    fault count, hit ratio, faults per `window` references and eviction
+    counts per page.
+
+    `hook(i, page, fault, memory)` is called for every `sample_every`-th
+    reference, for the cases where per-step visibility is really needed.
+    """
+    access = engine.access
+    faults = 0
+    evictions = {}
+    series = array("q")
+    in_window = 0
+    left = window           # References left in the current window
+    sample = 0
+    i = -1
+
+    for i, p in enumerate(pages):
+        fault = access(p)
+        if fault:
+            faults += 1
+            in_window += 1
+            victim = engine.evicted
+            if victim is not None:
+                evictions[victim] = evictions.get(victim, 0) + 1
+
+        left -= 1
+        if left == 0:
+            series.append(in_window)
+            in_window = 0
+            left = window
+
+        if hook is not None:
+            if sample == 0:
+                hook(i, p, fault, engine.memory)
+                sample = sample_every
+            sample -= 1
+
+        if not quiet:
+            print(echo.format(p=p, memory=engine.memory))
+
+    if not quiet:
+        return faults
+
+    if left != window:
+        series.append(in_window)        # Last, partial window
+    return ReplacementReport(i + 1, faults, window, series, evictions,
+                             list(engine.memory))
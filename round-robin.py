@@ -2,56 +2,259 @@
 # ROUND ROBIN CPU Scheduling
 # ----------------------------------------------------
 
-def round_robin(processes, quantum):
-    # Deep copy + initialize
-    procs = [p.copy() for p in processes]
-    for p in procs:
-        p["remaining"] = p["burst"]
+from collections import deque
+
+from gantt import Gantt
+from process_table import ProcessTable
+
+
+def _fast_forward(queue, remaining, start, completion, time, quantum, limit):
+    # Apply whole rounds of the current queue in one step. A round serves
+    # every queued process once, in queue order, and leaves the survivors
+    # in the same order, so as long as nobody arrives (all rounds must end
+    # before `limit`) the outcome only depends on how many rounds each
+    # process needs: ceil(remaining / quantum).
+    # The caller guarantees that at least the first round fits.
+    m = len(queue)
+
+    # Everyone gets dispatched in the first round
+    t = time
+    for i in queue:
+        if start[i] < 0:
+            start[i] = t
+        t += min(quantum, remaining[i])
+
+    order = sorted(range(m), key=lambda j: (remaining[queue[j]] - 1) // quantum)
+
+    # Fenwick tree over queue positions of still-alive processes
+    tree = [0] * (m + 1)
+    for j in range(1, m + 1):
+        tree[j] += 1
+        if j + (j & -j) <= m:
+            tree[j + (j & -j)] += tree[j]
+
+    alive = m
+    rounds = 0      # Whole rounds applied so far
+    k = 0
+    while k < m and alive:
+        level = (remaining[queue[order[k]]] - 1) // quantum
+
+        # Rounds in which nobody finishes
+        full = min(level - rounds, (limit - time - 1) // (alive * quantum))
+        time += full * alive * quantum
+        rounds += full
+        if rounds < level:
+            break
+
+        # Next round: everyone at this level finishes during it
+        group = []
+        while k < m and (remaining[queue[order[k]]] - 1) // quantum == level:
+            group.append(order[k])
+            k += 1
+        group.sort()
+
+        short = sum(quantum - (remaining[queue[j]] - level * quantum) for j in group)
+        if time + alive * quantum - short >= limit:
+            k -= len(group)
+            break
+
+        saved = 0
+        for j in group:
+            # Alive processes ahead of j each ran a full quantum, except
+            # earlier finishers in this group which ran only their residue
+            ahead, x = 0, j
+            while x > 0:
+                ahead += tree[x]
+                x -= x & -x
+            res = remaining[queue[j]] - level * quantum
+            completion[queue[j]] = time + ahead * quantum - saved + res
+            saved += quantum - res
+        for j in group:
+            x = j + 1
+            while x <= m:
+                tree[x] -= 1
+                x += x & -x
+            remaining[queue[j]] = 0
+
+        time += alive * quantum - short
+        alive -= len(group)
+        rounds += 1
+
+    if rounds == 0:
+        return time, queue
+
+    survivors = deque()
+    for i in queue:
+        if remaining[i] > 0:
+            remaining[i] -= rounds * quantum
+            survivors.append(i)
+    return time, survivors
+
+
+def rr_schedule(arrival, burst, quantum, fast_forward=True, chart=None):
+    # Core scheduler over parallel columns.
+    # Returns (start, completion) per process; if a Gantt chart is given
+    # every dispatch is recorded in it. A chart needs one segment per
+    # dispatch anyway, so fast-forward is skipped in that case.
+    if chart is not None:
+        fast_forward = False
+    n = len(arrival)
+    order = sorted(range(n), key=arrival.__getitem__)
+    remaining = list(burst)
+    start = [-1] * n
+    completion = [0] * n
 
     time = 0
-    queue = []
+    queue = deque()
     completed = 0
-    n = len(procs)
 
-    # Sort by arrival
-    procs.sort(key=lambda x: x["arrival"])
+    # Dispatches left before the current round is over
+    round_left = 0
 
     # Start with first arrival
-    i = 0
+    nxt = 0
     while completed < n:
         # Add all arriving processes to queue
-        while i < n and procs[i]["arrival"] <= time:
-            queue.append(procs[i])
-            i += 1
+        while nxt < n and arrival[order[nxt]] <= time:
+            queue.append(order[nxt])
+            nxt += 1
 
         if not queue:
-            time += 1
+            # CPU idle: jump straight to the next arrival
+            time = arrival[order[nxt]]
             continue
 
-        current = queue.pop(0)
+        if round_left == 0:
+            # Fast-forward whole rounds if the next arrival is at least
+            # one full round away
+            if fast_forward:
+                limit = arrival[order[nxt]] if nxt < n else float("inf")
+                if limit - time > len(queue) * quantum:
+                    before = len(queue)
+                    time, queue = _fast_forward(queue, remaining, start, completion,
+                                                time, quantum, limit)
+                    completed += before - len(queue)
+                    if not queue:
+                        continue
+            round_left = len(queue)
+
+        current = queue.popleft()
+        round_left -= 1
+        if start[current] < 0:
+            start[current] = time
 
         # Execute current process
-        exec_time = min(quantum, current["remaining"])
-        current["remaining"] -= exec_time
+        exec_time = min(quantum, remaining[current])
+        if chart is not None:
+            chart.add(current, time, time + exec_time)
+        remaining[current] -= exec_time
         time += exec_time
 
         # Add newly arrived processes during execution
-        while i < n and procs[i]["arrival"] <= time:
-            queue.append(procs[i])
-            i += 1
+        while nxt < n and arrival[order[nxt]] <= time:
+            queue.append(order[nxt])
+            nxt += 1
 
-        if current["remaining"] > 0:
+        if remaining[current] > 0:
             queue.append(current)
         else:
-            current["completion"] = time
+            completion[current] = time
             completed += 1
 
+    return start, completion
+
+
+def round_robin(processes, quantum, fast_forward=True, gantt=False):
+    # With gantt=True returns (processes, Gantt chart) like the
+    # preemptive schedulers, otherwise just the processes
+    if isinstance(processes, ProcessTable):
+        # Results go straight into the table's columns
+        chart = Gantt(processes.pid) if gantt else None
+        start, completion = rr_schedule(processes.arrival, processes.burst,
+                                        quantum, fast_forward, chart)
+        processes.set_results(start, completion)
+        return (processes, chart) if gantt else processes
+
+    # Deep copy + initialize
+    procs = [p.copy() for p in processes]
+
+    # Sort by arrival
+    procs.sort(key=lambda x: x["arrival"])
+
+    chart = Gantt([p["pid"] for p in procs]) if gantt else None
+    _, completion = rr_schedule([p["arrival"] for p in procs],
+                                [p["burst"] for p in procs],
+                                quantum, fast_forward, chart)
+
     # Calculate metrics
-    for p in procs:
+    for p, c in zip(procs, completion):
+        p["remaining"] = 0
+        p["completion"] = c
         p["turnaround"] = p["completion"] - p["arrival"]
         p["waiting"] = p["turnaround"] - p["burst"]
 
-    return procs
+    return (procs, chart) if gantt else procs
+
+
+def round_robin_stream(jobs, quantum):
+    # Streaming Round Robin over an arrival-ordered iterator of job dicts.
+    # Yields ("segment", {"pid", "start", "end"}) and ("completion", job)
+    # as soon as each is final. Only the ready queue plus one look-ahead
+    # job are held in memory.
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+
+    time = 0
+    queue = deque()
+    segment = None      # Open Gantt segment: [job, start, end]
+
+    def arrivals(pending):
+        # Move every job that has arrived by `time` into the queue
+        while pending is not None and pending["arrival"] <= time:
+            p = pending.copy()
+            p["remaining"] = p["burst"]
+            queue.append(p)
+            pending = next(jobs, None)
+            if pending is not None and pending["arrival"] < p["arrival"]:
+                raise ValueError("round_robin_stream() needs jobs in arrival order")
+        return pending
+
+    while pending is not None or queue:
+        pending = arrivals(pending)
+
+        if not queue:
+            # CPU idle: jump straight to the next arrival
+            time = pending["arrival"]
+            continue
+
+        current = queue.popleft()
+
+        # A different process (or an idle gap) closes the open segment
+        if segment and (segment[0] is not current or segment[2] != time):
+            yield "segment", {"pid": segment[0]["pid"], "start": segment[1], "end": segment[2]}
+            segment = None
+
+        exec_time = min(quantum, current["remaining"])
+        if segment:
+            segment[2] = time + exec_time
+        elif exec_time > 0:
+            segment = [current, time, time + exec_time]
+        current["remaining"] -= exec_time
+        time += exec_time
+
+        # Add newly arrived processes during execution
+        pending = arrivals(pending)
+
+        if current["remaining"] > 0:
+            queue.append(current)
+        else:
+            if segment:
+                yield "segment", {"pid": segment[0]["pid"], "start": segment[1], "end": segment[2]}
+                segment = None
+            current["completion"] = time
+            current["turnaround"] = current["completion"] - current["arrival"]
+            current["waiting"] = current["turnaround"] - current["burst"]
+            yield "completion", current
 
 
 # -------------------------
@@ -66,7 +269,12 @@ if __name__ == "__main__":
     ]
 
     quantum = 2
-    result = round_robin(processes, quantum)
+    result, gantt = round_robin(processes, quantum, gantt=True)
 
+    print("Process Details:")
     for p in result:
         print(p)
+
+    print("\nGantt Chart:")
+    for pid, start, end in gantt.segments():
+        print(f"{pid}: {start} -> {end}")
@@ -2,34 +2,65 @@
 # SJF NON-PREEMPTIVE CPU Scheduling
 # ----------------------------------------------------
 
-def sjf_non_preemptive(processes):
-    n = len(processes)
-    procs = [p.copy() for p in processes]
+import heapq
+
+from process_table import ProcessTable
+
+
+def sjf_schedule(arrival, burst):
+    # Core scheduler over parallel columns.
+    # Returns (dispatch order, start time per process).
+    n = len(arrival)
+    start = [0] * n
+    dispatched = []
     time = 0
-    completed = 0
-    result = []
 
-    while completed < n:
+    # Cursor over processes in arrival order
+    order = sorted(range(n), key=arrival.__getitem__)
+    nxt = 0
 
-        ready = [p for p in procs if p['arrival'] <= time and 'done' not in p]
+    # Min-heap of ready processes: shortest burst, then arrival, then input order
+    ready = []
+
+    while len(dispatched) < n:
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            heapq.heappush(ready, (burst[i], arrival[i], i))
+            nxt += 1
 
         if not ready:
-            time += 1
+            # CPU idle: jump straight to the next arrival
+            time = arrival[order[nxt]]
             continue
 
-        # Choose shortest burst time
-        ready.sort(key=lambda x: x['burst'])
-        p = ready[0]
+        i = heapq.heappop(ready)[2]
+        start[i] = time
+        time += burst[i]
+        dispatched.append(i)
+
+    return dispatched, start
 
-        p['start'] = time
-        time += p['burst']
-        p['completion'] = time
+
+def sjf_non_preemptive(processes):
+    if isinstance(processes, ProcessTable):
+        # Results go straight into the table's columns
+        _, start = sjf_schedule(processes.arrival, processes.burst)
+        processes.set_results(start, [s + b for s, b in zip(start, processes.burst)])
+        return processes
+
+    procs = [p.copy() for p in processes]
+    dispatched, start = sjf_schedule([p['arrival'] for p in procs],
+                                     [p['burst'] for p in procs])
+
+    result = []
+    for i in dispatched:
+        p = procs[i]
+        p['start'] = start[i]
+        p['completion'] = p['start'] + p['burst']
         p['turnaround'] = p['completion'] - p['arrival']
         p['waiting'] = p['turnaround'] - p['burst']
         p['done'] = True
-
         result.append(p)
-        completed += 1
 
     return result
 
@@ -2,48 +2,108 @@
 # SJF PREEMPTIVE (SRTF) CPU Scheduling
 # ----------------------------------------------------
 
+import heapq
+
+from preemptive_engine import run_preemptive
+from process_table import ProcessTable
+
+
 def sjf_preemptive(processes):
+    if isinstance(processes, ProcessTable):
+        # Results go straight into the table's columns
+        start, completion, gantt = run_preemptive(
+            processes.arrival,
+            processes.burst,
+            pids=processes.pid,
+        )
+        processes.set_results(start, completion)
+        return processes, gantt
+
     procs = [p.copy() for p in processes]
-    for p in procs:
-        p['remaining'] = p['burst']
+
+    # Event-driven simulation: jump between arrivals and completions
+    # instead of ticking one unit at a time
+    _, completion, gantt = run_preemptive(
+        [p['arrival'] for p in procs],
+        [p['burst'] for p in procs],
+        pids=[p['pid'] for p in procs],
+    )
+
+    # Calculate metrics
+    for p, c in zip(procs, completion):
+        p['remaining'] = 0
+        p['completion'] = c
+        p['turnaround'] = p['completion'] - p['arrival']
+        p['waiting'] = p['turnaround'] - p['burst']
+
+    return procs, gantt
+
+
+def sjf_preemptive_stream(jobs):
+    # Streaming SRTF over an arrival-ordered iterator of job dicts.
+    # Yields ("segment", {"pid", "start", "end"}) and ("completion", job)
+    # as soon as each is final. Memory is bounded by the ready set.
+    jobs = iter(jobs)
+    pending = next(jobs, None)
 
     time = 0
-    completed = 0
-    n = len(procs)
-    last_pid = None
-    gantt = []
+    seq = 0             # Input position, the tie-break for equal remaining time
+    ready = []          # (remaining, seq, job)
+    current = None
+    segment = None      # Open Gantt segment: [job, start, end]
 
-    while completed < n:
-        # Get ready processes
-        ready = [p for p in procs if p['arrival'] <= time and p['remaining'] > 0]
+    while pending is not None or ready or current:
+        # Admit everything that has arrived by now
+        while pending is not None and pending['arrival'] <= time:
+            p = pending.copy()
+            p['remaining'] = p['burst']
+            heapq.heappush(ready, (p['remaining'], seq, p))
+            seq += 1
+            pending = next(jobs, None)
+            if pending is not None and pending['arrival'] < p['arrival']:
+                raise ValueError("sjf_preemptive_stream() needs jobs in arrival order")
+
+        # Running process competes again with its updated remaining time
+        if current:
+            heapq.heappush(ready, current)
+            current = None
 
         if not ready:
-            time += 1
+            # CPU idle: jump straight to the next arrival
+            time = pending['arrival']
             continue
 
-        # Choose process with smallest remaining burst
-        ready.sort(key=lambda x: x['remaining'])
-        current = ready[0]
+        current = heapq.heappop(ready)
+        p = current[2]
 
-        # Gantt chart tracking
-        if last_pid != current['pid']:
-            gantt.append({"pid": current['pid'], "start": time})
-            last_pid = current['pid']
+        # Run until completion or the next arrival, whichever is first
+        run = p['remaining']
+        if pending is not None:
+            run = min(run, pending['arrival'] - time)
 
-        # Execute process for 1 unit
-        current['remaining'] -= 1
-        time += 1
+        # A different process (or an idle gap) closes the open segment
+        if segment and (segment[0] is not p or segment[2] != time):
+            yield "segment", {"pid": segment[0]['pid'], "start": segment[1], "end": segment[2]}
+            segment = None
+        if segment:
+            segment[2] = time + run
+        elif run > 0:
+            segment = [p, time, time + run]
 
-        if current['remaining'] == 0:
-            current['completion'] = time
-            completed += 1
+        p['remaining'] -= run
+        time += run
 
-    # Calculate metrics
-    for p in procs:
-        p['turnaround'] = p['completion'] - p['arrival']
-        p['waiting'] = p['turnaround'] - p['burst']
-
-    return procs, gantt
+        if p['remaining'] == 0:
+            if segment:
+                yield "segment", {"pid": p['pid'], "start": segment[1], "end": segment[2]}
+                segment = None
+            p['completion'] = time
+            p['turnaround'] = p['completion'] - p['arrival']
+            p['waiting'] = p['turnaround'] - p['burst']
+            current = None
+            yield "completion", p
+        else:
+            current = (p['remaining'], current[1], p)
 
 
 # -------------------------
@@ -0,0 +1,269 @@
+# ----------------------------------------------------
+# Multi-core (SMP) CPU Scheduling Simulation
+# FCFS, SJF, SRTF, Priority (both) and Round Robin on N CPUs
+# ----------------------------------------------------
+# Event driven: a heap of "CPU finishes its current slice" events plus
+# an arrival cursor, so the clock jumps from event to event.
+#
+# Dispatch policies:
+#   "global" - one shared ready queue, any idle CPU takes the next job
+#   "steal"  - one ready queue per CPU (arrivals spread round robin);
+#              an idle CPU with an empty queue steals from the longest
+#
+# With cpus=1 every policy reproduces the single-CPU schedulers.
+# ----------------------------------------------------
+
+import heapq
+from collections import deque
+
+from gantt import Gantt
+from process_table import ProcessTable
+
+POLICIES = ("fcfs", "sjf", "srtf", "priority", "priority_preemptive", "rr")
+DISPATCH = ("global", "steal")
+
+
+def smp_schedule_columns(arrival, burst, cpus, policy="fcfs", priority=None,
+                         quantum=None, dispatch="global", pids=None):
+    """
+    Core SMP simulation over parallel columns.
+
+    Returns (start, completion, charts) where charts[c] is the Gantt
+    chart of CPU c, labelled with `pids`.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {POLICIES}")
+    if dispatch not in DISPATCH:
+        raise ValueError(f"unknown dispatch {dispatch!r}, expected one of {DISPATCH}")
+    if policy in ("priority", "priority_preemptive") and priority is None:
+        raise ValueError(f"policy {policy!r} needs a priority column")
+    if policy == "rr" and not quantum:
+        raise ValueError("policy 'rr' needs a quantum")
+    if cpus < 1:
+        raise ValueError("need at least one CPU")
+
+    n = len(arrival)
+    order = sorted(range(n), key=arrival.__getitem__)
+    remaining = list(burst)
+    start = [-1] * n
+    completion = [0] * n
+    charts = [Gantt(pids) for _ in range(cpus)]
+
+    preemptive = policy in ("srtf", "priority_preemptive")
+    fifo = policy == "rr"
+
+    def key(i):
+        if policy == "fcfs":
+            return (arrival[i], i)
+        if policy == "sjf":
+            return (burst[i], arrival[i], i)
+        if policy == "priority":
+            return (priority[i], arrival[i], i)
+        if policy == "srtf":
+            return (remaining[i], i)
+        return (priority[i], i)
+
+    # Ready queues: deques for RR, heaps of (key, index) otherwise
+    nqueues = cpus if dispatch == "steal" else 1
+    queues = [deque() if fifo else [] for _ in range(nqueues)]
+    waiting = [0]               # Jobs over all queues
+
+    def push(q, i):
+        waiting[0] += 1
+        if fifo:
+            queues[q].append(i)
+        else:
+            heapq.heappush(queues[q], (key(i), i))
+
+    def pop(q):
+        waiting[0] -= 1
+        return queues[q].popleft() if fifo else heapq.heappop(queues[q])[1]
+
+    def peek_key(q):
+        return queues[q][0][0]
+
+    running = [-1] * cpus       # Index running on each CPU
+    since = [0] * cpus          # When the current slice started
+    epoch = [0] * cpus          # Invalidates stale events after a preemption
+    events = []                 # (time, cpu, epoch)
+    idle = list(range(cpus))    # Min-heap of idle CPUs
+    worst = []                  # Max-heap of running keys (preemptive only)
+
+    def running_key(c):
+        i = running[c]
+        if policy == "srtf":
+            return (remaining[i] - (time - since[c]), i)
+        return (priority[i], i)
+
+    def run(c, i):
+        running[c] = i
+        since[c] = time
+        epoch[c] += 1
+        if start[i] < 0:
+            start[i] = time
+        length = min(quantum, remaining[i]) if fifo else remaining[i]
+        heapq.heappush(events, (time + length, c, epoch[c]))
+        if preemptive:
+            if policy == "srtf":
+                # Remaining time now is (remaining + since) - t, so the
+                # projected finish time orders running jobs for all t
+                heapq.heappush(worst, (-(remaining[i] + time), -i, c, epoch[c]))
+            else:
+                heapq.heappush(worst, (-priority[i], -i, c, epoch[c]))
+
+    def stop(c):
+        # Take the running job off CPU c, charging the time it ran
+        i = running[c]
+        ran = time - since[c]
+        remaining[i] -= ran
+        charts[c].add(i, since[c], time)
+        running[c] = -1
+        epoch[c] += 1
+        return i
+
+    def take(c):
+        # Next job for idle CPU c, stealing from the longest queue if needed
+        q = c if dispatch == "steal" else 0
+        if queues[q]:
+            return pop(q)
+        if dispatch == "steal":
+            victim = max(range(cpus), key=lambda v: len(queues[v]))
+            if queues[victim]:
+                return pop(victim)
+        return -1
+
+    time = 0
+    nxt = 0
+    done = 0
+    spread = 0                  # Round-robin placement of arrivals
+
+    while done < n:
+        # Next event time: earliest valid CPU event or next arrival
+        while events and epoch[events[0][1]] != events[0][2]:
+            heapq.heappop(events)
+        upcoming = [events[0][0]] if events else []
+        if nxt < n:
+            upcoming.append(arrival[order[nxt]])
+        time = max(time, min(upcoming))
+
+        # 1. CPUs whose slice ends now
+        expired = []
+        while events and events[0][0] <= time:
+            _, c, e = heapq.heappop(events)
+            if epoch[c] != e:
+                continue
+            i = stop(c)
+            if remaining[i] == 0:
+                completion[i] = time
+                done += 1
+            else:
+                expired.append((c, i))
+            heapq.heappush(idle, c)
+
+        # 2. Arrivals (before re-queued RR jobs, like the single-CPU version)
+        touched = set()
+        while nxt < n and arrival[order[nxt]] <= time:
+            i = order[nxt]
+            q = spread % nqueues
+            spread += 1
+            push(q, i)
+            touched.add(q)
+            nxt += 1
+
+        # 3. Quantum expiries go to the back of their queue
+        for c, i in expired:
+            q = c if dispatch == "steal" else 0
+            push(q, i)
+            touched.add(q)
+
+        # 4. Fill idle CPUs
+        parked = []
+        while idle and waiting[0]:
+            c = heapq.heappop(idle)
+            i = take(c)
+            if i < 0:
+                parked.append(c)
+                continue
+            run(c, i)
+        for c in parked:
+            heapq.heappush(idle, c)
+
+        # 5. Preempt running jobs that rank worse than a waiting one
+        if preemptive:
+            if dispatch == "global":
+                while queues[0]:
+                    while worst and epoch[worst[0][2]] != worst[0][3]:
+                        heapq.heappop(worst)
+                    if not worst:
+                        break
+                    c = worst[0][2]
+                    if peek_key(0) >= running_key(c):
+                        break
+                    heapq.heappop(worst)
+                    push(0, stop(c))
+                    run(c, pop(0))
+            else:
+                for c in touched:
+                    if running[c] >= 0 and queues[c] and peek_key(c) < running_key(c):
+                        push(c, stop(c))
+                        run(c, pop(c))
+
+    return start, completion, charts
+
+
+def smp_schedule(processes, cpus, policy="fcfs", quantum=None, dispatch="global"):
+    """
+    N-CPU version of the schedulers.
+
+    `processes` is a list of dicts or a ProcessTable. Returns
+    (result, gantt) where gantt[c] is the Gantt chart of CPU c.
+    A ProcessTable gets its result columns filled in; for dicts a
+    copy is returned in input order with start/completion/turnaround/
+    waiting added.
+    """
+    if isinstance(processes, ProcessTable):
+        table = processes
+        start, completion, gantt = smp_schedule_columns(
+            table.arrival, table.burst, cpus, policy,
+            table.priority if table.has_priority else None, quantum, dispatch,
+            table.pid)
+        table.set_results(start, completion)
+        result = table
+    else:
+        procs = [p.copy() for p in processes]
+        has_priority = bool(procs) and all("priority" in p for p in procs)
+        start, completion, gantt = smp_schedule_columns(
+            [p["arrival"] for p in procs], [p["burst"] for p in procs], cpus, policy,
+            [p["priority"] for p in procs] if has_priority else None, quantum, dispatch,
+            [p["pid"] for p in procs])
+        for p, s, c in zip(procs, start, completion):
+            p["start"] = s
+            p["completion"] = c
+            p["turnaround"] = c - p["arrival"]
+            p["waiting"] = p["turnaround"] - p["burst"]
+        result = procs
+
+    return result, gantt
+
+
+# -------------------------
+# Example run
+# -------------------------
+if __name__ == "__main__":
+    processes = [
+        {"pid": "P1", "arrival": 0, "burst": 5, "priority": 2},
+        {"pid": "P2", "arrival": 1, "burst": 3, "priority": 1},
+        {"pid": "P3", "arrival": 2, "burst": 8, "priority": 3},
+        {"pid": "P4", "arrival": 3, "burst": 6, "priority": 2},
+        {"pid": "P5", "arrival": 4, "burst": 2, "priority": 1}
+    ]
+
+    for dispatch in DISPATCH:
+        result, gantt = smp_schedule(processes, cpus=2, policy="srtf", dispatch=dispatch)
+
+        print(f"SRTF on 2 CPUs ({dispatch} dispatch):")
+        for p in result:
+            print(p)
+        for c, chart in enumerate(gantt):
+            print(f"CPU{c}:", list(chart.segments()))
+        print()
@@ -0,0 +1,208 @@
+# -------------------------------------------------------------------
+# Stack-distance analysis (Mattson et al.)
+# Page-fault counts for EVERY frame count from one pass over a trace
+# -------------------------------------------------------------------
+# LRU and OPT are stack algorithms: the pages held with k frames are
+# always a subset of those held with k + 1 frames. A reference at stack
+# depth d therefore hits for every k >= d and faults for every k < d,
+# and a histogram of depths gives the whole fault curve at once.
+#
+#   faults = lru_fault_curve(pages, 1000)   # faults[k - 1] for k frames
+#   mrc = miss_ratio_curve(pages, 1000)     # faults / len(pages)
+# -------------------------------------------------------------------
+
+from array import array
+
+from replacement_policies import next_uses
+
+
+class Fenwick:
+    # Binary indexed tree over positions 0..size-1 (point add, prefix sum)
+
+    def __init__(self, size):
+        self.size = size
+        self.tree = array("q", bytes(8 * (size + 1)))
+
+    def add(self, i, delta):
+        i += 1
+        tree, size = self.tree, self.size
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        # Sum of positions 0..i-1
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+def _curve(depths, cold, max_frames):
+    # faults[k - 1] = references whose depth is deeper than k, plus cold misses
+    faults = array("q", bytes(8 * max_frames))
+    deeper = cold + sum(depths[max_frames + 1:])
+    for k in range(max_frames, 0, -1):
+        faults[k - 1] = deeper
+        deeper += depths[k]
+    return faults
+
+
+class LRUStack:
+    """
+    LRU stack depth of each reference, one reference at a time.
+
+    depth(p) returns the depth at which p was found (1 = most recently
+    used) or 0 for a first reference. A Fenwick tree marks each page's
+    last access, so one reference costs O(log distinct pages). Positions
+    are renumbered when the tree fills up, so memory stays proportional
+    to the number of distinct pages rather than the trace length.
+    """
+
+    def __init__(self):
+        self.last = {}              # page -> position of its last access
+        self.capacity = 1 << 16
+        self.tree = Fenwick(self.capacity)
+        self.pos = 0
+
+    def __len__(self):
+        return len(self.last)
+
+    def _compact(self):
+        # Renumber live pages 0..d-1 keeping their order
+        last = self.last
+        live = sorted(last, key=last.get)
+        self.capacity = max(2 * len(live), 1 << 16)
+        self.tree = tree = Fenwick(self.capacity)
+        for i, q in enumerate(live):
+            last[q] = i
+            tree.add(i, 1)
+        self.pos = len(live)
+
+    def depth(self, p):
+        if self.pos == self.capacity:
+            self._compact()
+        tree, pos = self.tree, self.pos
+
+        prev = self.last.get(p)
+        if prev is None:
+            depth = 0
+        else:
+            depth = tree.prefix(pos) - tree.prefix(prev + 1) + 1
+            tree.add(prev, -1)
+
+        tree.add(pos, 1)
+        self.last[p] = pos
+        self.pos = pos + 1
+        return depth
+
+
+def lru_stack_distances(pages):
+    # LRU stack depth of every reference, in one pass. Returns
+    # (histogram, cold): histogram[d] counts references found at depth d
+    # (d >= 1), cold counts first references.
+    histogram = array("q", [0, 0])
+    cold = 0
+    depth_of = LRUStack().depth
+
+    for p in pages:
+        depth = depth_of(p)
+        if depth == 0:
+            cold += 1
+            continue
+        if depth >= len(histogram):
+            histogram.extend(bytes(8 * (depth + 1 - len(histogram))))
+        histogram[depth] += 1
+
+    return histogram, cold
+
+
+def lru_fault_curve(pages, max_frames):
+    # faults[k - 1] = LRU page faults with k frames, k = 1..max_frames
+    histogram, cold = lru_stack_distances(pages)
+    histogram.extend(bytes(8 * max(0, max_frames + 1 - len(histogram))))
+    return _curve(histogram, cold, max_frames)
+
+
+def opt_fault_curve(pages, max_frames):
+    """
+    faults[k - 1] = optimal (Belady) page faults with k frames.
+
+    Uses Mattson's priority-stack update with "next use" as the priority.
+    Only the top max_frames entries are kept (the update of the top k
+    entries never looks deeper), but each reference still walks down to
+    the referenced page, so the cost is O(n * max_frames) in the worst
+    case: one pass instead of max_frames simulations.
+    """
+    nxt = next_uses(pages)
+    depths = array("q", bytes(8 * (max_frames + 2)))
+    cold = 0
+    seen = set()
+    stack = []                  # Top of stack first
+    upcoming = {}               # page -> index of its next reference
+
+    for i, p in enumerate(pages):
+        try:
+            depth = stack.index(p) + 1
+        except ValueError:
+            depth = 0
+
+        if depth:
+            depths[depth] += 1
+            end = depth - 1
+        else:
+            if p in seen:
+                depths[max_frames + 1] += 1
+            else:
+                cold += 1
+                seen.add(p)
+            end = len(stack)
+
+        upcoming[p] = nxt[i]
+
+        # p goes on top; the old entries above its position are merged
+        # downwards, the page needed sooner keeping each position
+        if stack:
+            carried = stack[0] if depth != 1 else None
+            stack[0] = p
+            if carried is not None:
+                for k in range(1, end):
+                    q = stack[k]
+                    if upcoming[q] > upcoming[carried]:
+                        stack[k], carried = carried, q
+                if depth:
+                    stack[depth - 1] = carried
+                elif len(stack) < max_frames:
+                    stack.append(carried)
+                else:
+                    del upcoming[carried]
+        else:
+            stack.append(p)
+
+    return _curve(depths, cold, max_frames)
+
+
+def miss_ratio_curve(pages, max_frames, policy="lru"):
+    # Miss ratio for k = 1..max_frames frames
+    if policy == "lru":
+        faults = lru_fault_curve(pages, max_frames)
+    elif policy == "optimal":
+        faults = opt_fault_curve(pages, max_frames)
+    else:
+        raise ValueError(f"no stack-distance analysis for policy {policy!r}")
+    n = len(pages) or 1
+    return array("d", (f / n for f in faults))
+
+
+# -------------------------------------------------------------------
+# Example run
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    pages = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3]
+
+    print("Pages:", pages)
+    print("Frames | LRU faults | OPT faults")
+    for k, (l, o) in enumerate(zip(lru_fault_curve(pages, 6), opt_fault_curve(pages, 6)), 1):
+        print(f"{k:>6} | {l:>10} | {o:>10}")
@@ -0,0 +1,180 @@
+# ----------------------------------------------------
+# Parallel parameter sweep over the CPU schedulers
+# ----------------------------------------------------
+# Runs every (algorithm, workload, parameter) cell across a process
+# pool and aggregates average waiting / turnaround time per cell.
+#
+#   python sweep.py work1.json work2.csv --quanta 1 2 4 8 --workers 8
+#
+# Workloads are shipped to each worker once (pool initializer) as
+# ProcessTables; a cell only carries (algorithm, workload name, param).
+# ----------------------------------------------------
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from process_table import to_process_table
+
+
+def load_module(filename):
+    # The scheduler scripts have names like "sjf-preemptive.py" that
+    # cannot be imported with a plain import statement
+    name = "_sched_" + "".join(c if c.isalnum() else "_" for c in filename[:-3])
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# name -> (file, function, needs priority, takes a parameter)
+ALGORITHMS = {
+    "fcfs": ("fcfs.py", "fcfs", False, False),
+    "sjf": ("sjf-Non-preemptive.py", "sjf_non_preemptive", False, False),
+    "sjf_preemptive": ("sjf-preemptive.py", "sjf_preemptive", False, False),
+    "priority": ("Priority Scheduling(Non-Preemptive).py", "priority_non_preemptive", True, False),
+    "priority_preemptive": ("Priority Scheduling (Preemptive).py", "priority_preemptive", True, False),
+    "round_robin": ("round-robin.py", "round_robin", False, True),
+}
+
+
+def get_scheduler(algorithm):
+    filename, func, _, _ = ALGORITHMS[algorithm]
+    return getattr(load_module(filename), func)
+
+
+# ---------------- Workloads ----------------
+def load_workload(path):
+    # JSON list of process dicts, or CSV with a pid,arrival,burst[,priority] header
+    if path.endswith(".json"):
+        with open(path) as f:
+            return to_process_table(json.load(f))
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        for key in ("arrival", "burst", "priority"):
+            if key in row:
+                row[key] = int(row[key])
+    return to_process_table(rows)
+
+
+# ---------------- Worker side ----------------
+_workloads = {}
+
+
+def _init_worker(workloads):
+    _workloads.update(workloads)
+
+
+def run_cell(cell):
+    algorithm, workload, param = cell
+    table = _workloads[workload]
+    scheduler = get_scheduler(algorithm)
+
+    if ALGORITHMS[algorithm][3]:
+        scheduler(table, param)
+    else:
+        scheduler(table)
+
+    n = len(table) or 1
+    return {
+        "algorithm": algorithm,
+        "workload": workload,
+        "param": param,
+        "processes": len(table),
+        "avg_waiting": sum(table.waiting) / n,
+        "avg_turnaround": sum(table.turnaround) / n,
+    }
+
+
+def _run_chunk(cells):
+    return [run_cell(cell) for cell in cells]
+
+
+# ---------------- Driver ----------------
+def make_cells(workloads, algorithms=None, quanta=(2,)):
+    cells = []
+    for algorithm in algorithms or ALGORITHMS:
+        _, _, needs_priority, takes_param = ALGORITHMS[algorithm]
+        for name, table in workloads.items():
+            if needs_priority and not table.has_priority:
+                continue
+            for param in (quanta if takes_param else (None,)):
+                cells.append((algorithm, name, param))
+    return cells
+
+
+def sweep(workloads, algorithms=None, quanta=(2,), workers=None, chunksize=None):
+    """
+    Run every (algorithm, workload, parameter) cell in parallel.
+
+    `workloads` maps a name to a list of process dicts or a ProcessTable.
+    Returns one result row per cell, sorted by (algorithm, workload, param).
+    """
+    workloads = {name: to_process_table(w) for name, w in workloads.items()}
+    cells = make_cells(workloads, algorithms, quanta)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        _init_worker(workloads)
+        rows = _run_chunk(cells)
+    else:
+        # A few chunks per worker keeps the pool busy without
+        # paying pickling overhead per cell
+        chunksize = chunksize or max(1, len(cells) // (workers * 4))
+        chunks = [cells[i:i + chunksize] for i in range(0, len(cells), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(workloads,)) as pool:
+            rows = [row for chunk in pool.map(_run_chunk, chunks) for row in chunk]
+
+    rows.sort(key=lambda r: (r["algorithm"], r["workload"], r["param"] or 0))
+    return rows
+
+
+def format_table(rows):
+    lines = [f"{'Algorithm':<20} {'Workload':<24} {'Param':>6} {'N':>9} {'Avg WT':>12} {'Avg TAT':>12}",
+             "-" * 88]
+    for r in rows:
+        param = "-" if r["param"] is None else r["param"]
+        lines.append(f"{r['algorithm']:<20} {r['workload']:<24} {param:>6} {r['processes']:>9} "
+                     f"{r['avg_waiting']:>12.2f} {r['avg_turnaround']:>12.2f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel scheduler sweep")
+    parser.add_argument("workloads", nargs="*", help="JSON or CSV workload files")
+    parser.add_argument("--algorithms", nargs="+", choices=sorted(ALGORITHMS))
+    parser.add_argument("--quanta", nargs="+", type=int, default=[2])
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--json", help="also write the result rows to this file")
+    args = parser.parse_args()
+
+    if args.workloads:
+        workloads = {os.path.basename(p): load_workload(p) for p in args.workloads}
+    else:
+        # Sample workload
+        workloads = {"sample": [
+            {"pid": "P1", "arrival": 0, "burst": 4, "priority": 2},
+            {"pid": "P2", "arrival": 1, "burst": 3, "priority": 1},
+            {"pid": "P3", "arrival": 2, "burst": 1, "priority": 3},
+            {"pid": "P4", "arrival": 3, "burst": 2, "priority": 2},
+        ]}
+
+    rows = sweep(workloads, args.algorithms, args.quanta, args.workers)
+    print(format_table(rows))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
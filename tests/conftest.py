@@ -0,0 +1,6 @@
+# The scripts under test live at the repository root, several of them
+# with names that need sweep.load_module() to import
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,62 @@
+# ----------------------------------------------------
+# Banker's algorithm: BankerState's safe-sequence cache
+# ----------------------------------------------------
+
+import random
+
+import pytest
+
+from sweep import load_module
+
+bankers = load_module("Bankers Algo.py")
+np = pytest.importorskip("numpy")
+
+
+def expected_decision(state, pid, request):
+    # Full recompute with the list safe_order() on copies of the state
+    available = [a - r for a, r in zip(state.available.tolist(), request)]
+    allocation = state.allocation.tolist()
+    need = state.need.tolist()
+    allocation[pid] = [a + r for a, r in zip(allocation[pid], request)]
+    need[pid] = [x - r for x, r in zip(need[pid], request)]
+    if min(available) < 0:
+        return bankers.WAIT
+    if bankers.safe_order(available, allocation, need) is None:
+        return bankers.UNSAFE
+    return bankers.GRANTED
+
+
+def check_cache(state):
+    # Cached work vectors match the matrices and cover every need
+    if state._order is None:
+        return
+    order = state._order
+    work = np.cumsum(state.allocation[order], axis=0) - state.allocation[order] + state.available
+    assert (state._work == work).all()
+    assert (state.need[order] <= work).all()
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_cached_decisions_match_full_recompute(seed):
+    rng = random.Random(seed)
+    cached = 0
+    for _ in range(500):
+        n, m = rng.randint(1, 8), rng.randint(1, 4)
+        maximum = [[rng.randint(0, 6) for _ in range(m)] for _ in range(n)]
+        allocation = [[rng.randint(0, x) for x in row] for row in maximum]
+        available = [rng.randint(0, 6) for _ in range(m)]
+        state = bankers.BankerState(available, maximum, allocation)
+
+        for _ in range(30):
+            pid = rng.randrange(n)
+            if rng.random() < 0.7:
+                request = [rng.randint(0, x) for x in state.need[pid].tolist()]
+                expected = expected_decision(state, pid, request)
+                cached += state._cache_allows(pid, np.asarray(request))
+                assert state.request(pid, request) == expected, (pid, request)
+            else:
+                state.release(pid, [rng.randint(0, x) for x in state.allocation[pid].tolist()])
+            check_cache(state)
+
+    # The cache path itself must have been exercised
+    assert cached > 0
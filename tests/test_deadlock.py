@@ -0,0 +1,72 @@
+# ----------------------------------------------------
+# Deadlock detection: WaitForGraph against brute-force reachability
+# ----------------------------------------------------
+
+import random
+
+import pytest
+
+from sweep import load_module
+
+deadlock = load_module("Deadlock Detection.py")
+
+
+def reachable_deadlock(nodes, edges):
+    # Brute force: processes on a cycle or reaching one
+    adj = {v: set() for v in nodes}
+    for p, q in edges:
+        adj[p].add(q)
+    reach = {}
+    for v in nodes:
+        seen, stack = set(), [v]
+        while stack:
+            for w in adj[stack.pop()]:
+                if w not in seen:
+                    seen.add(w)
+                    stack.append(w)
+        reach[v] = seen
+    cyclic = {v for v in nodes if v in reach[v]}
+    return {v for v in nodes if v in cyclic or reach[v] & cyclic}
+
+
+def check_graph(graph, nodes, edges):
+    # The acyclic part respects the order and every edge is held exactly
+    # once, in the acyclic part or as a cycle edge
+    held = dict(graph.cycle_edges)
+    for p, succ in graph.succ.items():
+        for q, count in succ.items():
+            assert graph.order[p] < graph.order[q], (p, q)
+            held[p, q] = held.get((p, q), 0) + count
+    expected = {}
+    for e in edges:
+        expected[e] = expected.get(e, 0) + 1
+    assert held == expected
+    assert set(graph.order) == nodes
+    assert graph.deadlocked() == reachable_deadlock(nodes, edges)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_wait_for_graph_matches_brute_force(seed):
+    # Random add_wait / remove_wait / remove_process sequences
+    rng = random.Random(seed)
+    for _ in range(500):
+        graph = deadlock.WaitForGraph()
+        edges = []
+        nodes = set()
+        size = rng.randint(1, 10)
+        for _ in range(60):
+            r = rng.random()
+            if r < 0.55 or not edges:
+                p, q = rng.randrange(size), rng.randrange(size)
+                graph.add_wait(p, q)
+                edges.append((p, q))
+                nodes |= {p, q}
+            elif r < 0.9:
+                edge = edges.pop(rng.randrange(len(edges)))
+                graph.remove_wait(*edge)
+            else:
+                v = rng.choice(sorted(nodes))
+                graph.remove_process(v)
+                nodes.discard(v)
+                edges = [e for e in edges if v not in e]
+            check_graph(graph, nodes, edges)
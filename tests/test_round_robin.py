@@ -0,0 +1,25 @@
+# ----------------------------------------------------
+# Round Robin: fast-forward against the plain dispatch loop
+# ----------------------------------------------------
+
+import random
+
+import pytest
+
+from sweep import load_module
+
+rr_schedule = load_module("round-robin.py").rr_schedule
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_fast_forward_matches_plain_loop(seed):
+    # Random workloads with bursty arrivals and long idle gaps
+    rng = random.Random(seed)
+    for _ in range(1000):
+        n = rng.randint(1, 12)
+        spread = rng.choice([0, 5, 40, 400])
+        arrival = [rng.randint(0, spread) for _ in range(n)]
+        burst = [rng.randint(1, rng.choice([3, 30, 300])) for _ in range(n)]
+        quantum = rng.randint(1, 6)
+        assert (rr_schedule(arrival, burst, quantum)
+                == rr_schedule(arrival, burst, quantum, fast_forward=False)), (arrival, burst, quantum)
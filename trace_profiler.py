@@ -0,0 +1,160 @@
+# -------------------------------------------------------------------
+# Trace profiler: working set and reuse distance in one pass
+# -------------------------------------------------------------------
+# Characterizes a page trace before choosing `frames`:
+#
+#   W(t, tau)       working set size: distinct pages among the last tau
+#                   references (Denning), for several window sizes tau
+#   reuse distance  LRU stack distance of each reference, as a
+#                   log-bucketed histogram (bucket b = distances in
+#                   [2^(b-1), 2^b - 1]); the LRU fault count with k
+#                   frames is the number of references deeper than k
+#
+# Memory is bounded by the largest tau plus the number of distinct
+# pages, so a multi-GB binary trace (page_trace.TraceReader) is walked
+# chunk by chunk without being loaded.
+#
+#   profile = profile_trace(pages, taus=(100, 1000, 10000))
+#   profile.mean_working_set[1000]
+# -------------------------------------------------------------------
+
+from array import array
+
+from stack_distance import LRUStack
+
+NEVER = 1 << 62
+
+
+class TraceProfile:
+    __slots__ = ("references", "distinct", "taus", "mean_working_set", "max_working_set",
+                 "working_set_series", "sample_every", "reuse_histogram", "cold")
+
+    def __init__(self, references, distinct, taus, mean_working_set, max_working_set,
+                 working_set_series, sample_every, reuse_histogram, cold):
+        self.references = references
+        self.distinct = distinct
+        self.taus = taus
+        self.mean_working_set = mean_working_set        # tau -> average W(t, tau)
+        self.max_working_set = max_working_set          # tau -> largest W(t, tau)
+        self.working_set_series = working_set_series    # tau -> W every sample_every refs
+        self.sample_every = sample_every
+        self.reuse_histogram = reuse_histogram          # Log buckets, see bucket_range()
+        self.cold = cold                                # First references
+
+    def reuse_buckets(self):
+        # (lowest distance, highest distance, count) per non-empty bucket
+        return [(*bucket_range(b), c) for b, c in enumerate(self.reuse_histogram) if c]
+
+    def __repr__(self):
+        ws = ", ".join(f"{t}: {self.mean_working_set[t]:.1f}" for t in self.taus)
+        return (f"TraceProfile(references={self.references}, distinct={self.distinct}, "
+                f"mean_working_set={{{ws}}})")
+
+
+def bucket_range(b):
+    # Reuse distances counted in histogram bucket b
+    return (1 << (b - 1), (1 << b) - 1) if b else (0, 0)
+
+
+def _chunks(pages):
+    return pages.chunks() if hasattr(pages, "chunks") else (pages,)
+
+
+def profile_trace(pages, taus=(100, 1000, 10000), sample_every=1000):
+    """
+    Working-set sizes and reuse-distance histogram of a trace, one pass.
+
+    W(t, tau) is kept incrementally for every tau: reference t adds its
+    page unless it was already used within the last tau references, and
+    reference t - tau drops out unless its page has been used again
+    since. A ring buffer of the last max(taus) references stores when
+    each one's page was next used, so both checks are O(1).
+    """
+    taus = sorted(set(taus))
+    if not taus or taus[0] < 1:
+        raise ValueError("window sizes must be positive")
+    span = taus[-1]
+    windows = range(len(taus))
+
+    ring = array("q", [NEVER]) * span      # Next use of reference t, at t % span
+    last = {}                               # page -> time of its last reference
+    ws = [0] * len(taus)
+    totals = [0] * len(taus)
+    peaks = [0] * len(taus)
+    series = [array("q") for _ in taus]
+    sample = 0
+
+    reuse = array("q", bytes(8 * 2))
+    cold = 0
+    depth_of = LRUStack().depth
+
+    t = 0
+    for chunk in _chunks(pages):
+        for p in chunk:
+            # Working sets
+            prev = last.get(p)
+            gap = t - prev if prev is not None else NEVER
+            if gap <= span:
+                ring[prev % span] = t
+            for w in windows:
+                tau = taus[w]
+                s = t - tau
+                if s >= 0 and ring[s % span] > t:
+                    ws[w] -= 1
+                if gap > tau:
+                    ws[w] += 1
+                totals[w] += ws[w]
+                if ws[w] > peaks[w]:
+                    peaks[w] = ws[w]
+            ring[t % span] = NEVER
+            last[p] = t
+
+            if sample == 0:
+                for w in windows:
+                    series[w].append(ws[w])
+                sample = sample_every
+            sample -= 1
+
+            # Reuse distance
+            depth = depth_of(p)
+            if depth:
+                b = depth.bit_length()
+                if b >= len(reuse):
+                    reuse.extend(bytes(8 * (b + 1 - len(reuse))))
+                reuse[b] += 1
+            else:
+                cold += 1
+
+            t += 1
+
+    mean = {tau: totals[w] / t if t else 0.0 for w, tau in enumerate(taus)}
+    peak = {tau: peaks[w] for w, tau in enumerate(taus)}
+    return TraceProfile(t, len(last), tuple(taus), mean, peak,
+                        {tau: series[w] for w, tau in enumerate(taus)},
+                        sample_every, reuse, cold)
+
+
+# -------------------------------------------------------------------
+# Example run
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    import random
+
+    rng = random.Random(0)
+    # Three phases with different localities
+    pages = ([rng.randint(0, 20) for _ in range(5000)]
+             + [rng.randint(100, 400) for _ in range(5000)]
+             + [rng.randint(0, 20) for _ in range(5000)])
+
+    profile = profile_trace(pages, taus=(10, 100, 1000), sample_every=2500)
+    print(profile)
+
+    print("\nWindow | Mean W | Max W | W over time")
+    for tau in profile.taus:
+        print(f"{tau:>6} | {profile.mean_working_set[tau]:>6.1f} | "
+              f"{profile.max_working_set[tau]:>5} | {list(profile.working_set_series[tau])}")
+
+    print("\nReuse distance | References")
+    print(f"{'cold':>14} | {profile.cold}")
+    for lo, hi, count in profile.reuse_buckets():
+        print(f"{f'{lo}-{hi}':>14} | {count}")